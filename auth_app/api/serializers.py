@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from profile_app.models import Profile
 
 User = get_user_model()
@@ -44,6 +45,7 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         """
         Creates a new user and its related profile.
@@ -21,3 +21,8 @@ class User(AbstractUser):
         max_length=20,
         choices=USER_TYPES
     )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['type'], name='user_type_idx'),
+        ]
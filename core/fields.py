@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+
+class ForeignKeyIdField(serializers.IntegerField):
+    """
+    Read-only field exposing the primary key of a related object.
+
+    The value is read from the local `<relation>_id` attribute, so the
+    related row is never loaded. The source names the relation, not the
+    ID column, and defaults to the field name.
+
+    Example:
+        reviewer = ForeignKeyIdField()            # reads review.reviewer_id
+        user = ForeignKeyIdField(source='owner')  # reads offer.owner_id
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        self.source_attrs = [*self.source_attrs[:-1], f'{self.source_attrs[-1]}_id']
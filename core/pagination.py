@@ -0,0 +1,239 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination with a stable tie-breaker on the primary key.
+
+    Pages are selected with a WHERE clause on the last seen
+    (ordering value, id) pair instead of an OFFSET, and no COUNT(*) is
+    issued, so every page costs the same no matter how deep it is.
+
+    Attributes:
+    - page_size: Default number of items per page.
+    - page_size_query_param: Query parameter to override the page size.
+    - max_page_size: Upper limit for the page size.
+    - cursor_query_param: Query parameter carrying the opaque cursor.
+    - ordering_param: Query parameter selecting the ordering (same as OrderingFilter).
+    - ordering_fields: Fields that may be used for ordering.
+    - default_ordering: Ordering used when none (or an unknown one) is requested.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    ordering_param = 'ordering'
+    ordering_fields = ('updated_at',)
+    default_ordering = '-updated_at'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(request)
+        self.model_field = queryset.model._meta.get_field(self.field)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor['reverse']
+        descending = self.descending != reverse
+
+        queryset = queryset.order_by(*self.get_order_by(descending))
+        if cursor is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(cursor['value'], cursor['id'], descending)
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request):
+        """
+        Return the (field, descending) pair used for paging.
+
+        Only the first term of the ordering parameter is used; the
+        primary key is always appended as tie-breaker.
+        """
+        ordering = request.query_params.get(self.ordering_param, '').split(',')[0].strip()
+        if ordering.lstrip('-') not in self.ordering_fields:
+            ordering = self.default_ordering
+        return ordering.lstrip('-'), ordering.startswith('-')
+
+    def get_order_by(self, descending):
+        """
+        Ascending order puts NULLs first and descending order puts them
+        last, so reversing the direction walks exactly the same sequence
+        backwards on every database.
+        """
+        if descending:
+            return [F(self.field).desc(nulls_last=True), F('pk').desc()]
+        return [F(self.field).asc(nulls_first=True), F('pk').asc()]
+
+    def get_position_filter(self, value, pk, descending):
+        """
+        Return a filter selecting the rows that come after (value, pk)
+        in the given direction.
+
+        The bound is written as `field <= value AND (field < value OR
+        pk < id)` (mirrored for ascending order), so the database can
+        range-seek the (..., field) index to the cursor position. NULLs
+        are only considered for nullable fields.
+        """
+        field = self.field
+        if descending:
+            if value is None:
+                return Q(**{f'{field}__isnull': True, 'pk__lt': pk})
+            position = Q(**{f'{field}__lte': value}) & (
+                Q(**{f'{field}__lt': value}) | Q(pk__lt=pk)
+            )
+            if self.model_field.null:
+                position |= Q(**{f'{field}__isnull': True})
+            return position
+        if value is None:
+            return Q(**{f'{field}__isnull': True, 'pk__gt': pk}) | Q(**{f'{field}__isnull': False})
+        return Q(**{f'{field}__gte': value}) & (Q(**{f'{field}__gt': value}) | Q(pk__gt=pk))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        value = getattr(instance, self.field)
+        payload = {
+            'o': self.field,
+            'v': None if value is None else self.model_field.value_to_string(instance),
+            'i': instance.pk,
+            'r': int(reverse),
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(',', ':')).encode()
+        ).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor from the request.
+
+        Returns None for the first page and raises NotFound for cursors
+        that are malformed or were issued for another ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if payload['o'] != self.field:
+                raise ValueError
+            value = payload['v']
+            return {
+                'value': None if value is None else self.model_field.to_python(value),
+                'id': int(payload['i']),
+                'reverse': bool(payload['r']),
+            }
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class CappedListPagination(BasePagination):
+    """
+    Plain-list pagination that returns at most `max_results` items.
+
+    Used as the default of list endpoints whose clients expect a JSON
+    array: the response keeps its shape but no longer grows with the
+    table. When more items match, the `X-Truncated: true` header is set;
+    clients read everything with `?pagination=cursor` or `?stream=true`.
+    """
+    max_results = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        results = list(queryset[:self.max_results + 1])
+        self.truncated = len(results) > self.max_results
+        return results[:self.max_results]
+
+    def get_paginated_response(self, data):
+        headers = {'X-Truncated': 'true'} if self.truncated else None
+        return Response(data, headers=headers)
+
+    def get_paginated_response_schema(self, schema):
+        return schema
+
+
+class OptionalKeysetPaginationMixin:
+    """
+    View mixin that switches a generic view to keyset pagination on request.
+
+    Clients opt in with `?pagination=cursor`; follow-up requests carry the
+    `cursor` parameter returned in the next/previous links. All other
+    requests keep using the view's regular `pagination_class`.
+    """
+    keyset_pagination_class = None
+    keyset_pagination_param = 'pagination'
+
+    def use_keyset_pagination(self):
+        params = self.request.query_params
+        return (
+            params.get(self.keyset_pagination_param) == 'cursor'
+            or self.keyset_pagination_class.cursor_query_param in params
+        )
+
+    @property
+    def paginator(self):
+        if (
+            not hasattr(self, '_paginator')
+            and self.keyset_pagination_class is not None
+            and self.use_keyset_pagination()
+        ):
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
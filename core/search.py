@@ -0,0 +1,165 @@
+import re
+
+from django.db import connections, migrations
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+
+class FullTextIndex:
+    """
+    Describes an SQLite FTS5 index over text columns of a model table.
+
+    The index is an external-content FTS5 table, so the text itself is
+    stored only once in the model table. Triggers on the model table keep
+    the index in sync on every insert, update and delete, including bulk
+    operations that bypass model signals.
+
+    Attributes:
+    - table: Name of the indexed model table.
+    - columns: Text columns that are indexed.
+    - name: Name of the FTS5 virtual table (defaults to '<table>_fts').
+    """
+
+    def __init__(self, table, columns, name=None):
+        self.table = table
+        self.columns = list(columns)
+        self.name = name or f'{table}_fts'
+
+    def _column_list(self, prefix=''):
+        return ', '.join(f'{prefix}"{column}"' for column in self.columns)
+
+    def create_sql(self):
+        """
+        SQL statements creating the FTS5 table, its sync triggers and
+        filling it from the existing rows.
+        """
+        return [
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{self.name}" USING fts5('
+            f'{self._column_list()}, content="{self.table}", content_rowid="id", '
+            f"tokenize='unicode61 remove_diacritics 2')",
+            *self.trigger_sql(),
+            f'INSERT INTO "{self.name}"("{self.name}") VALUES (\'rebuild\')',
+        ]
+
+    def trigger_sql(self):
+        """
+        SQL statements (re)creating the triggers that keep the index in sync.
+
+        SQLite drops triggers together with their table, so migrations that
+        rebuild the model table must run these statements again.
+        """
+        insert = (
+            f'INSERT INTO "{self.name}"(rowid, {self._column_list()}) '
+            f'VALUES (new."id", {self._column_list("new.")});'
+        )
+        delete = (
+            f'INSERT INTO "{self.name}"("{self.name}", rowid, {self._column_list()}) '
+            f'VALUES (\'delete\', old."id", {self._column_list("old.")});'
+        )
+        return [
+            f'CREATE TRIGGER IF NOT EXISTS "{self.name}_ai" AFTER INSERT ON "{self.table}" '
+            f'BEGIN {insert} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{self.name}_ad" AFTER DELETE ON "{self.table}" '
+            f'BEGIN {delete} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{self.name}_au" AFTER UPDATE OF {self._column_list()} '
+            f'ON "{self.table}" BEGIN {delete} {insert} END',
+        ]
+
+    def drop_sql(self):
+        """
+        SQL statements removing the triggers and the FTS5 table.
+        """
+        return [
+            f'DROP TRIGGER IF EXISTS "{self.name}_ai"',
+            f'DROP TRIGGER IF EXISTS "{self.name}_ad"',
+            f'DROP TRIGGER IF EXISTS "{self.name}_au"',
+            f'DROP TABLE IF EXISTS "{self.name}"',
+        ]
+
+    def _run(self, statements):
+        def operation(apps, schema_editor):
+            if schema_editor.connection.vendor != 'sqlite':
+                return
+            for statement in statements():
+                schema_editor.execute(statement, params=None)
+        return operation
+
+    def create_operation(self):
+        """
+        Migration operation creating the index (no-op on other databases).
+        """
+        return migrations.RunPython(
+            self._run(self.create_sql),
+            self._run(self.drop_sql),
+        )
+
+    def restore_triggers_operation(self):
+        """
+        Migration operation recreating the sync triggers after the model
+        table has been rebuilt (no-op on other databases).
+        """
+        return migrations.RunPython(
+            self._run(self.trigger_sql),
+            migrations.RunPython.noop,
+        )
+
+    def match_expression(self, terms):
+        """
+        Build an FTS5 MATCH expression from free-text search terms.
+
+        Every word becomes a quoted prefix query, so 'web dev' matches
+        'website development'. All words must match.
+        """
+        words = [
+            word
+            for term in terms
+            for word in re.findall(r'\w+', term)
+        ]
+        return ' '.join(f'"{word}"*' for word in words)
+
+    def search(self, queryset, terms):
+        """
+        Restrict the queryset to rows matching the search terms and
+        annotate them with search_rank (lower is more relevant).
+        """
+        expression = self.match_expression(terms)
+        if not expression:
+            return queryset
+
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM "{self.name}" WHERE "{self.name}" MATCH %s',
+                [expression],
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT rank FROM "{self.name}" '
+                f'WHERE "{self.name}" MATCH %s AND rowid = "{table}"."id"',
+                [expression],
+            )
+        )
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Search filter backed by a full-text index.
+
+    Views declare the index through a `search_index` attribute. On SQLite
+    the `search` query parameter is answered from the FTS5 index with prefix
+    matching; results are ordered by relevance unless the client explicitly
+    requested an ordering. Other databases fall back to the regular
+    SearchFilter over `search_fields`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_index = getattr(view, 'search_index', None)
+        if search_index is None or connections[queryset.db].vendor != 'sqlite':
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = search_index.search(queryset, self.get_search_terms(request))
+
+        if 'search_rank' in queryset.query.annotations and not request.query_params.get('ordering'):
+            queryset = queryset.order_by('search_rank', *queryset.query.order_by)
+
+        return queryset
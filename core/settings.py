@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
 import os 
 
@@ -52,7 +53,8 @@ INSTALLED_APPS = [
     'offers_app',
     'orders_app',
     'reviews_app',
-    'platform_app'
+    'platform_app',
+    'jobs_app',
 ]
 
 MIDDLEWARE = [
@@ -97,6 +99,27 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The offer response cache works with the local-memory backend below as well
+# as with 'django.core.cache.backends.filebased.FileBasedCache'.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'coderr',
+    }
+}
+
+# Seconds a cached offers list or offer response is kept at most.
+OFFER_CACHE_TIMEOUT = 300
+DASHBOARD_CACHE_TIMEOUT = 300
+RATING_STATS_CACHE_TIMEOUT = 3600
+
+# How long an Idempotency-Key for POST /api/orders/ is remembered.
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,59 @@
+import json
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def stream_json_list(queryset, serializer_class, context=None, chunk_size=500):
+    """
+    Serialize a queryset as a JSON array that is streamed to the client.
+
+    Rows are read with queryset.iterator(chunk_size=...) (a server-side
+    cursor where the database supports it, with prefetch_related applied
+    per chunk) and serialized one chunk at a time, so memory stays bounded
+    by the chunk size instead of the result size.
+    """
+    def chunks():
+        rows = queryset.iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def generate():
+        yield '['
+        first = True
+        for chunk in chunks():
+            for item in serializer_class(chunk, many=True, context=context).data:
+                prefix = '' if first else ','
+                first = False
+                yield prefix + json.dumps(
+                    item, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')
+                )
+        yield ']'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+
+class StreamingListMixin:
+    """
+    View mixin adding an opt-in streaming mode to list endpoints.
+
+    Clients request it with `?stream=true`; the full result is then sent
+    as a streamed JSON array without pagination.
+    """
+    stream_query_param = 'stream'
+    stream_chunk_size = 500
+
+    def wants_stream(self, request):
+        return request.query_params.get(self.stream_query_param, '').lower() in ('1', 'true')
+
+    def stream_response(self, queryset, serializer_class, context=None):
+        return stream_json_list(
+            queryset,
+            serializer_class,
+            context=context,
+            chunk_size=self.stream_chunk_size,
+        )
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import Job
+
+class JobExtension(admin.ModelAdmin):
+    list_display = ("id", "task", "status", "attempts", "run_at", "updated_at")
+    list_filter = ("status", "task")
+
+admin.site.register(Job, JobExtension)
@@ -0,0 +1,91 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from jobs_app.queue import claim_jobs, purge_finished_jobs, run_job
+
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    """
+    Runs queued background jobs with a pool of worker threads.
+
+    The main thread claims as many due jobs as there are idle threads and
+    hands them to the pool; when the queue is empty it polls again after
+    --poll-interval seconds. No external broker is needed. Finished jobs
+    older than JOB_RETENTION are deleted on start and once an hour.
+    """
+    help = "Process background jobs from the database queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help="Number of worker threads (default: 4).",
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling an empty queue again (default: 1).",
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Exit as soon as no due jobs are left instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        threads = options['threads']
+        poll_interval = options['poll_interval']
+        running = set()
+        next_purge = 0
+
+        self.stdout.write(f"Starting {threads} worker threads.")
+
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='job-worker') as pool:
+            try:
+                while True:
+                    running = {future for future in running if not future.done()}
+
+                    if time.monotonic() >= next_purge:
+                        purge_finished_jobs(timezone.now())
+                        next_purge = time.monotonic() + PURGE_INTERVAL
+
+                    jobs = claim_jobs(threads - len(running)) if len(running) < threads else []
+                    for job in jobs:
+                        future = pool.submit(self.run_in_thread, job)
+                        future.add_done_callback(self.report(job))
+                        running.add(future)
+
+                    if jobs:
+                        continue
+                    if running:
+                        wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                    elif options['once']:
+                        break
+                    else:
+                        time.sleep(poll_interval)
+            except KeyboardInterrupt:
+                self.stdout.write("Stopping, waiting for running jobs to finish...")
+
+    def run_in_thread(self, job):
+        """
+        Run a job on a pool thread and close that thread's database
+        connections afterwards.
+        """
+        try:
+            return run_job(job)
+        finally:
+            connections.close_all()
+
+    def report(self, job):
+        def callback(future):
+            status = 'crashed' if future.exception() else future.result()
+            self.stdout.write(f"Job {job.pk} ({job.task}): {status}")
+        return callback
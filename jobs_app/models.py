@@ -0,0 +1,52 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A unit of background work stored in the database.
+
+    Jobs are inserted in the same transaction as the write that enqueues
+    them, so workers only see them once that transaction has committed
+    and never see them if it rolls back. `manage.py run_workers` claims
+    due jobs and runs the task registered under `task`.
+
+    Fields:
+    - task: Name of the registered task function.
+    - payload: Keyword arguments passed to the task (JSON).
+    - status: queued, running, succeeded or failed.
+    - attempts: Number of times the job has been started.
+    - max_attempts: After this many failed attempts the job is marked failed.
+    - run_at: Earliest time the job may run (pushed back after failures).
+    - locked_at: When the job was claimed by a worker.
+    - locked_by: Token of the claim, so only the claiming worker finishes the job.
+    - last_error: Traceback of the latest failure.
+    - created_at / updated_at: Timestamps.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    task = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=64, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='job_status_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} ({self.status})"
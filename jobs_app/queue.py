@@ -0,0 +1,162 @@
+import logging
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs_app.models import Job
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE_DELAY = getattr(settings, 'JOB_RETRY_BASE_DELAY', 10)
+RETRY_MAX_DELAY = getattr(settings, 'JOB_RETRY_MAX_DELAY', 3600)
+LOCK_TIMEOUT = getattr(settings, 'JOB_LOCK_TIMEOUT', 600)
+RETENTION = getattr(settings, 'JOB_RETENTION', 7 * 24 * 3600)
+
+_tasks = {}
+
+
+def task(func=None, *, name=None):
+    """
+    Register a function as a background task.
+
+    Tasks are looked up by name (default: '<module>.<function>') and called
+    with the job payload as keyword arguments. A job may run more than once
+    (e.g. after a worker crash), so tasks should be idempotent.
+
+    Apps define their tasks in a `tasks.py` module, which is imported on
+    startup.
+    """
+    def register(func):
+        func.task_name = name or f'{func.__module__}.{func.__name__}'
+        _tasks[func.task_name] = func
+        return func
+
+    if func is not None:
+        return register(func)
+    return register
+
+
+def enqueue(task_or_name, payload=None, *, delay=None, max_attempts=5):
+    """
+    Add a job to the queue and return it.
+
+    The job row is written on the current database connection, so inside a
+    transaction it becomes visible to workers only when that transaction
+    commits, and disappears with it on rollback.
+
+    Example: enqueue(send_summary, {'order_id': order.id})
+    """
+    name = getattr(task_or_name, 'task_name', task_or_name)
+    if name not in _tasks:
+        raise LookupError(f"Unknown task '{name}'.")
+
+    run_at = timezone.now()
+    if delay is not None:
+        run_at += delay
+
+    return Job.objects.create(
+        task=name,
+        payload=payload or {},
+        run_at=run_at,
+        max_attempts=max_attempts,
+    )
+
+
+def retry_delay(attempts):
+    """
+    Exponential backoff: base delay doubled per failed attempt, capped.
+    """
+    return timedelta(seconds=min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY))
+
+
+def release_stale_jobs(now):
+    """
+    Return jobs whose worker has not finished them within LOCK_TIMEOUT to
+    the queue, or mark them failed when no attempts are left.
+    """
+    stale = Job.objects.filter(
+        status='running',
+        locked_at__lt=now - timedelta(seconds=LOCK_TIMEOUT)
+    )
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed', locked_by='', last_error='Worker did not finish the job in time.', updated_at=now
+    )
+    stale.update(status='queued', locked_by='', updated_at=now)
+
+
+def purge_finished_jobs(now):
+    """
+    Delete succeeded and failed jobs that finished more than RETENTION
+    seconds ago. Returns the number of deleted jobs.
+    """
+    deleted, _ = Job.objects.filter(
+        status__in=['succeeded', 'failed'],
+        updated_at__lt=now - timedelta(seconds=RETENTION)
+    ).delete()
+    return deleted
+
+
+def claim_jobs(limit):
+    """
+    Claim up to `limit` due jobs for this worker.
+
+    The claim is a single conditional UPDATE tagged with a fresh token, so
+    concurrent workers never run the same job.
+    """
+    now = timezone.now()
+    release_stale_jobs(now)
+
+    candidates = list(
+        Job.objects
+        .filter(status='queued', run_at__lte=now)
+        .order_by('run_at', 'pk')
+        .values_list('pk', flat=True)[:limit]
+    )
+    if not candidates:
+        return []
+
+    token = uuid.uuid4().hex
+    Job.objects.filter(pk__in=candidates, status='queued').update(
+        status='running',
+        locked_at=now,
+        locked_by=token,
+        attempts=F('attempts') + 1,
+        updated_at=now,
+    )
+    return list(Job.objects.filter(locked_by=token, status='running'))
+
+
+def run_job(job):
+    """
+    Run a claimed job and record the outcome. Returns the new status.
+
+    The task runs in a transaction of its own. A failed job is queued
+    again after retry_delay() until max_attempts is reached.
+    """
+    try:
+        func = _tasks.get(job.task)
+        if func is None:
+            raise LookupError(f"Unknown task '{job.task}'.")
+
+        with transaction.atomic():
+            func(**job.payload)
+    except Exception:
+        logger.exception("Job %s (%s) failed", job.pk, job.task)
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            changes = {'status': 'failed'}
+        else:
+            changes = {'status': 'queued', 'run_at': now + retry_delay(job.attempts)}
+        result = changes['status']
+        changes.update(locked_by='', last_error=traceback.format_exc(), updated_at=now)
+    else:
+        result = 'succeeded'
+        changes = {'status': result, 'locked_by': '', 'last_error': '', 'updated_at': timezone.now()}
+
+    Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(**changes)
+    return result
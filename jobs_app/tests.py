@@ -0,0 +1,185 @@
+import tempfile
+from datetime import timedelta, timezone as dt_timezone
+
+from django.core.cache.backends.filebased import FileBasedCache
+from django.test import TestCase
+from django.utils import timezone
+
+from auth_app.models import User
+from jobs_app.models import Job
+from jobs_app.queue import (
+    LOCK_TIMEOUT,
+    RETENTION,
+    claim_jobs,
+    enqueue,
+    purge_finished_jobs,
+    release_stale_jobs,
+    retry_delay,
+    run_job,
+    task,
+)
+from reviews_app.models import Review
+from reviews_app.rating_stats import rating_stats_key
+
+calls = []
+
+
+@task(name='jobs_app.tests.record')
+def record(value):
+    calls.append(value)
+
+
+@task(name='jobs_app.tests.explode')
+def explode():
+    raise RuntimeError('boom')
+
+
+class JobQueueTests(TestCase):
+    """
+    Claiming, retrying and releasing jobs of the database-backed queue.
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_rejects_unknown_task(self):
+        with self.assertRaises(LookupError):
+            enqueue('jobs_app.tests.missing')
+
+    def test_claim_locks_job_once(self):
+        job = enqueue(record, {'value': 1})
+
+        claimed = claim_jobs(10)
+
+        self.assertEqual([j.pk for j in claimed], [job.pk])
+        self.assertEqual(claimed[0].status, 'running')
+        self.assertEqual(claimed[0].attempts, 1)
+        self.assertTrue(claimed[0].locked_by)
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_claim_skips_jobs_that_are_not_due(self):
+        enqueue(record, {'value': 1}, delay=timedelta(minutes=5))
+
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_successful_job(self):
+        enqueue(record, {'value': 1})
+        job = claim_jobs(1)[0]
+
+        self.assertEqual(run_job(job), 'succeeded')
+
+        job.refresh_from_db()
+        self.assertEqual(calls, [1])
+        self.assertEqual(job.status, 'succeeded')
+        self.assertEqual(job.locked_by, '')
+
+    def test_failed_job_is_retried_with_backoff(self):
+        enqueue(explode, max_attempts=3)
+        job = claim_jobs(1)[0]
+        before = timezone.now()
+
+        self.assertEqual(run_job(job), 'queued')
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(job.locked_by, '')
+        self.assertIn('boom', job.last_error)
+        self.assertGreaterEqual(job.run_at, before + retry_delay(1))
+        self.assertLessEqual(job.run_at, timezone.now() + retry_delay(1))
+        self.assertEqual(claim_jobs(1), [])
+
+    def test_retry_delay_doubles_and_is_capped(self):
+        self.assertEqual(retry_delay(2), 2 * retry_delay(1))
+        self.assertEqual(retry_delay(100), retry_delay(101))
+
+    def test_job_fails_after_max_attempts(self):
+        enqueue(explode, max_attempts=1)
+        job = claim_jobs(1)[0]
+
+        self.assertEqual(run_job(job), 'failed')
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.attempts, 1)
+
+    def test_stale_job_is_requeued(self):
+        enqueue(record, {'value': 1}, max_attempts=2)
+        job = claim_jobs(1)[0]
+
+        release_stale_jobs(timezone.now() + timedelta(seconds=LOCK_TIMEOUT + 1))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(job.locked_by, '')
+
+    def test_stale_job_without_attempts_left_fails(self):
+        enqueue(record, {'value': 1}, max_attempts=1)
+        job = claim_jobs(1)[0]
+
+        release_stale_jobs(timezone.now() + timedelta(seconds=LOCK_TIMEOUT + 1))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertTrue(job.last_error)
+
+    def test_finished_job_of_released_worker_is_not_overwritten(self):
+        enqueue(record, {'value': 1}, max_attempts=2)
+        job = claim_jobs(1)[0]
+        release_stale_jobs(timezone.now() + timedelta(seconds=LOCK_TIMEOUT + 1))
+
+        run_job(job)
+
+        self.assertEqual(Job.objects.get(pk=job.pk).status, 'queued')
+
+
+class RatingStatsJobTests(TestCase):
+    """
+    Review writes queue a rating-stats rebuild only when the worker's cache
+    entry is visible to the web server.
+    """
+
+    def setUp(self):
+        self.business = User.objects.create_user(username='business', password='password', type='business')
+        self.customer = User.objects.create_user(username='customer', password='password', type='customer')
+
+    def create_review(self):
+        return Review.objects.create(
+            business_user=self.business, reviewer=self.customer, rating=4, description='Good'
+        )
+
+    def test_no_job_with_per_process_cache(self):
+        self.create_review()
+
+        self.assertFalse(Job.objects.exists())
+
+    def test_job_fills_shared_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}
+            with self.settings(CACHES={'default': backend}):
+                self.create_review()
+                self.assertEqual(run_job(claim_jobs(1)[0]), 'succeeded')
+
+            # A separate cache instance stands in for the web server process.
+            other_process = FileBasedCache(location, {})
+            today = timezone.now().astimezone(dt_timezone.utc).date()
+            stats = other_process.get(rating_stats_key(self.business.id, today))
+
+        self.assertEqual(stats['review_count'], 1)
+        self.assertEqual(stats['average_rating'], 4)
+
+
+class PurgeFinishedJobsTests(TestCase):
+
+    def test_only_old_finished_jobs_are_deleted(self):
+        old = timezone.now() - timedelta(seconds=RETENTION + 1)
+        for status in ('succeeded', 'failed', 'queued', 'running'):
+            Job.objects.create(task='jobs_app.tests.record', status=status)
+        Job.objects.update(updated_at=old)
+        recent = Job.objects.create(task='jobs_app.tests.record', status='succeeded')
+
+        self.assertEqual(purge_finished_jobs(timezone.now()), 2)
+
+        self.assertEqual(
+            set(Job.objects.values_list('status', flat=True)), {'queued', 'running', 'succeeded'}
+        )
+        self.assertTrue(Job.objects.filter(pk=recent.pk).exists())
@@ -8,7 +8,24 @@ class OfferDetailExtension(admin.ModelAdmin):
     list_display = ("id", "offer", "title", "price", "delivery_time_in_days")
 
 class OfferFeatureExtension(admin.ModelAdmin):
+    """
+    Features are not covered by cache or ETag receivers, so every admin
+    write marks the details of the affected offers as changed.
+    """
     list_display = ("id", "detail", "name")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        Offer.objects.filter(details=obj.detail_id).mark_details_changed()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Offer.objects.filter(details=obj.detail_id).mark_details_changed()
+
+    def delete_queryset(self, request, queryset):
+        detail_ids = list(queryset.values_list('detail_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        Offer.objects.filter(details__in=detail_ids).mark_details_changed()
     
 admin.site.register(Offer, OfferExtension)
 admin.site.register(OfferDetail, OfferDetailExtension)
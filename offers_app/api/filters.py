@@ -9,15 +9,15 @@ class OfferFilter(django_filters.FilterSet):
 
     Filters:
     - creator_id: Filters offers by the owner's user ID.
-    - min_price: Filters offers that have a detail price greater than or equal to this value.
-    - max_delivery_time: Filters offers that have a delivery time less than or equal to this value.
+    - min_price: Filters offers whose lowest detail price is greater than or equal to this value.
+    - max_delivery_time: Filters offers whose shortest delivery time is less than or equal to this value.
     """
     creator_id = django_filters.NumberFilter(field_name='owner__id')
     min_price = django_filters.NumberFilter(
-        field_name='details__price', lookup_expr='gte'
+        field_name='min_price', lookup_expr='gte'
     )
     max_delivery_time = django_filters.NumberFilter(
-        field_name='details__delivery_time_in_days', lookup_expr='lte'
+        field_name='min_delivery_time', lookup_expr='lte'
     )
 
     class Meta:
@@ -1,5 +1,7 @@
 from rest_framework.pagination import PageNumberPagination
 
+from core.pagination import KeysetPagination
+
 class LargeResultsSetPagination(PageNumberPagination):
     """
     Custom pagination class for API endpoints that return large result sets.
@@ -11,4 +13,19 @@ class LargeResultsSetPagination(PageNumberPagination):
     """
     page_size = 1
     page_size_query_param = 'page_size'
-    max_page_size = 10
\ No newline at end of file
+    max_page_size = 10
+
+
+class OfferCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the offers list.
+
+    Supports the same orderings as the list view (updated_at, min_price)
+    with the offer ID as tie-breaker, and returns opaque next/previous
+    cursors instead of page numbers, so no COUNT(*) or OFFSET is needed.
+    """
+    page_size = 1
+    page_size_query_param = 'page_size'
+    max_page_size = 10
+    ordering_fields = ('updated_at', 'min_price')
+    default_ordering = '-updated_at'
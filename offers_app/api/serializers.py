@@ -1,6 +1,13 @@
+from collections import Counter
+
 from rest_framework import serializers
+from django.db import transaction
 from offers_app.models import Offer, OfferDetail, OfferFeature
+from offers_app import cache as offer_cache
+from platform_app.dashboard import invalidate_dashboard
+from platform_app.models import PlatformCounters
 from profile_app.models import Profile
+from core.fields import ForeignKeyIdField
 
 
 class OfferDetailSerializer(serializers.ModelSerializer):
@@ -40,11 +47,69 @@ class OfferDetailSerializer(serializers.ModelSerializer):
         return data
 
 
+class OfferBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer used by OffersSerializer(many=True) for bulk imports.
+
+    All offers are validated up front by the child serializer. Offers,
+    details and features are then inserted with one bulk_create per table
+    inside a single transaction. bulk_create sends no signals, so the
+    platform counters and the offers cache are updated explicitly.
+    """
+    batch_size = 500
+
+    @transaction.atomic
+    def create(self, validated_data):
+        """
+        Create all offers with their details and features.
+
+        Every returned offer carries the created details in `bulk_details`.
+        """
+        owner = self.context['request'].user
+
+        offers = []
+        for offer_data in validated_data:
+            fields = {key: value for key, value in offer_data.items() if key != 'details'}
+            details_data = offer_data['details']
+            offers.append(Offer(
+                owner=owner,
+                min_price=min((d['price'] for d in details_data), default=None),
+                min_delivery_time=min((d['delivery_time_in_days'] for d in details_data), default=None),
+                **fields
+            ))
+        Offer.objects.bulk_create(offers, batch_size=self.batch_size)
+
+        details = []
+        features = []
+        for offer, offer_data in zip(offers, validated_data):
+            offer.bulk_details = []
+            for detail_data in offer_data['details']:
+                fields = {key: value for key, value in detail_data.items() if key != 'features'}
+                detail = OfferDetail(offer=offer, **fields)
+                offer.bulk_details.append(detail)
+                details.append(detail)
+                features.append(detail_data.get('features', []))
+        OfferDetail.objects.bulk_create(details, batch_size=self.batch_size)
+
+        OfferFeature.objects.bulk_create([
+            OfferFeature(detail=detail, name=name)
+            for detail, names in zip(details, features)
+            for name in names
+        ], batch_size=self.batch_size)
+
+        PlatformCounters.adjust(offer_count=len(offers))
+        offer_cache.invalidate(offer_cache.OFFERS_TAG)
+        invalidate_dashboard(owner.id)
+
+        return offers
+
+
 class OffersSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and displaying Offer instances including nested OfferDetails.
     - Nested serializer for details (OfferDetailSerializer)
     - Supports bulk creation of features.
+    - With many=True, creates whole catalogs via OfferBulkListSerializer.
     """
     details = OfferDetailSerializer(many=True)
 
@@ -57,7 +122,9 @@ class OffersSerializer(serializers.ModelSerializer):
             'description',
             'details',
         ]
+        list_serializer_class = OfferBulkListSerializer
 
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create an Offer with nested OfferDetails and Features.
@@ -83,6 +150,8 @@ class OffersSerializer(serializers.ModelSerializer):
                 for feature in features
             ])
 
+        Offer.objects.filter(pk=offer.pk).mark_details_changed()
+
         return offer
     
 class OfferListDetailSerializer(serializers.ModelSerializer):
@@ -127,35 +196,19 @@ class FilterListDetailSerializer(serializers.ModelSerializer):
 class OffersListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing Offers.
-    - Includes minimal price and delivery time.
+    - Includes minimal price and delivery time (stored on the offer).
     - Includes minimal profile information of the owner.
+    Expects details and owner.profile to be loaded in bulk by the view.
     """
     details = OfferListDetailSerializer(many=True)
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
-    user = serializers.IntegerField(source='owner.id', read_only=True)
+    min_price = serializers.IntegerField(read_only=True)
+    min_delivery_time = serializers.IntegerField(read_only=True)
+    user = ForeignKeyIdField(source='owner')
     user_details = ProfileMiniSerializer(
         source='owner.profile',
         read_only=True
     )
 
-    def get_min_price(self, obj):
-        prices = obj.details.values_list('price', flat=True)
-
-        if not prices:
-            return None
-
-        return int(min(prices))
-    
-    def get_min_delivery_time(self, obj):
-        delivery_times = obj.details.values_list('delivery_time_in_days', flat=True)
-
-        if not delivery_times:
-            return None
-
-        return int(min(delivery_times))
-
-
     class Meta:
         model = Offer
         fields = [
@@ -175,28 +228,13 @@ class OffersListSerializer(serializers.ModelSerializer):
 class OfferPrimaryKeySerializer(serializers.ModelSerializer):
     """
     Serializer for a single Offer with minimal information.
-    - Includes min_price and min_delivery_time.
+    - Includes min_price and min_delivery_time (stored on the offer).
     """
     details = OfferListDetailSerializer(many=True)
-    min_price = serializers.SerializerMethodField()
-    min_delivery_time = serializers.SerializerMethodField()
-    user = serializers.IntegerField(source='owner.id', read_only=True)
-
-    def get_min_price(self, obj):
-        prices = obj.details.values_list('price', flat=True)
+    min_price = serializers.IntegerField(read_only=True)
+    min_delivery_time = serializers.IntegerField(read_only=True)
+    user = ForeignKeyIdField(source='owner')
 
-        if not prices:
-            return None
-
-        return int(min(prices))
-    
-    def get_min_delivery_time(self, obj):
-        delivery_times = obj.details.values_list('delivery_time_in_days', flat=True)
-
-        if not delivery_times:
-            return None
-
-        return int(min(delivery_times))
     class Meta:
         model = Offer
         fields = [
@@ -319,40 +357,110 @@ class OfferDetailsWithPrimaryKeySerializer(serializers.ModelSerializer):
 
         return details
 
+    @transaction.atomic
     def update(self, instance, validated_data):
+        """
+        Apply a partial update by diffing against the stored offer.
+
+        - Offer fields are only saved when a value actually changed.
+        - Details are matched by offer_type; changed details are written
+          with one bulk_update, new details with one bulk_create.
+        - Features are compared per detail; only removed names are deleted
+          and only added names are inserted.
+
+        When nothing changed, no write is issued and updated_at is left alone.
+        min_price and min_delivery_time are only recomputed when a price or
+        delivery time changed or a detail was added.
+        """
         details_data = validated_data.pop('details', None)
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        changed_fields = [
+            attr for attr, value in validated_data.items()
+            if getattr(instance, attr) != value
+        ]
+        for attr in changed_fields:
+            setattr(instance, attr, validated_data[attr])
+        if changed_fields:
+            instance.save(update_fields=[*changed_fields, 'updated_at'])
 
         if details_data is not None:
-            existing_details = {
-                detail.offer_type: detail
-                for detail in instance.details.all()
-            }
-
-            for detail_data in details_data:
-                features = detail_data.pop('features', None)
-                offer_type = detail_data.get('offer_type')
-
-                if offer_type in existing_details:
-                    detail = existing_details[offer_type]
-                    for attr, value in detail_data.items():
-                        setattr(detail, attr, value)
-                    detail.save()
-                else:
-                    detail = OfferDetail.objects.create(
-                        offer=instance,
-                        **detail_data
-                    )
-
-                if features is not None:
-                    detail.features.all().delete()
-
-                    OfferFeature.objects.bulk_create([
-                        OfferFeature(detail=detail, name=name)
-                        for name in features
-                    ])
+            changed, min_values_changed = self.apply_detail_changes(instance, details_data)
+            if changed:
+                Offer.objects.filter(pk=instance.pk).mark_details_changed(
+                    min_values=min_values_changed
+                )
+                offer_cache.invalidate(offer_cache.OFFERS_TAG, offer_cache.offer_tag(instance.pk))
+                invalidate_dashboard(instance.owner_id)
 
         return instance
+
+    def apply_detail_changes(self, instance, details_data):
+        """
+        Write only the differences between details_data and the stored
+        details and features of the offer.
+
+        Returns:
+            A (changed, min_values_changed) pair: whether anything was
+            written, and whether a price or delivery time was written.
+        """
+        existing_details = {
+            detail.offer_type: detail
+            for detail in OfferDetail.objects.filter(offer=instance).prefetch_related('features')
+        }
+
+        changed_details = []
+        changed_fields = set()
+        new_details = []
+        new_features = []
+        removed_feature_ids = []
+
+        for detail_data in details_data:
+            fields = {
+                attr: value for attr, value in detail_data.items()
+                if attr not in ('id', 'features')
+            }
+            features = detail_data.get('features')
+            detail = existing_details.get(fields['offer_type'])
+
+            if detail is None:
+                detail = OfferDetail(offer=instance, **fields)
+                new_details.append(detail)
+                new_features.extend(
+                    OfferFeature(detail=detail, name=name) for name in features or []
+                )
+                continue
+
+            changed = [attr for attr, value in fields.items() if getattr(detail, attr) != value]
+            if changed:
+                for attr in changed:
+                    setattr(detail, attr, fields[attr])
+                changed_details.append(detail)
+                changed_fields.update(changed)
+
+            if features is not None:
+                missing = Counter(features)
+                for feature in detail.features.all():
+                    if missing[feature.name] > 0:
+                        missing[feature.name] -= 1
+                    else:
+                        removed_feature_ids.append(feature.id)
+
+                for name in features:
+                    if missing[name] > 0:
+                        missing[name] -= 1
+                        new_features.append(OfferFeature(detail=detail, name=name))
+
+        if changed_details:
+            OfferDetail.objects.bulk_update(changed_details, sorted(changed_fields))
+        if new_details:
+            OfferDetail.objects.bulk_create(new_details)
+        if removed_feature_ids:
+            OfferFeature.objects.filter(id__in=removed_feature_ids).delete()
+        if new_features:
+            OfferFeature.objects.bulk_create(new_features)
+
+        changed = bool(changed_details or new_details or removed_feature_ids or new_features)
+        min_values_changed = bool(
+            new_details or changed_fields & {'price', 'delivery_time_in_days'}
+        )
+        return changed, min_values_changed
@@ -3,23 +3,52 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from .serializers import OffersSerializer, OffersListSerializer, OfferPrimaryKeySerializer, AllDetailsForOfferSerializer, OfferDetailsWithPrimaryKeySerializer
 from offers_app.models import Offer, OfferDetail
-from offers_app.api.pagination import LargeResultsSetPagination
+from offers_app.api.pagination import LargeResultsSetPagination, OfferCursorPagination
+from offers_app.search import offer_search_index
+from offers_app import cache as offer_cache
+from core.pagination import OptionalKeysetPaginationMixin
+from core.search import FullTextSearchFilter
 from rest_framework.generics import ListCreateAPIView
-from django.db.models import Min
 from rest_framework import filters, status
 from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 from rest_framework import serializers
 
 
-class OffersView(ListCreateAPIView):
+def get_offer_validators(prefix, pk, updated_at, version):
+    """
+    Build a strong ETag and the Last-Modified timestamp for an offer resource.
+
+    The ETag combines the resource, Offer.updated_at and Offer.version,
+    so it changes with every edit of the offer, its details or features.
+    """
+    etag = quote_etag(f"{prefix}{pk}-{version}-{updated_at.timestamp():.6f}")
+    return etag, int(updated_at.timestamp())
+
+
+def set_validators(response, etag, last_modified):
+    """
+    Attach the ETag and Last-Modified headers to a full or a 304 response.
+    """
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class OffersView(OptionalKeysetPaginationMixin, ListCreateAPIView):
     """
     Handles listing and creation of offers.
 
     - GET:
       Returns a paginated list of all offers.
+      Pagination is page-number based by default; `?pagination=cursor`
+      switches to keyset pagination with opaque next/previous cursors.
       Supports:
         - ordering (updated_at, min_price)
-        - searching (title, description)
+        - full-text searching (title, description) with prefix matching,
+          ranked by relevance unless an ordering is given
         - filtering by creator, minimum price and maximum delivery time
 
     - POST:
@@ -28,10 +57,12 @@ class OffersView(ListCreateAPIView):
     """
     serializer_class = OffersListSerializer
     pagination_class = LargeResultsSetPagination
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    keyset_pagination_class = OfferCursorPagination
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
     ordering_fields = ['updated_at', 'min_price']
     ordering = ['-updated_at'] 
     search_fields = ['title', 'description']
+    search_index = offer_search_index
 
     def get_permissions(self):
         """
@@ -44,18 +75,22 @@ class OffersView(ListCreateAPIView):
 
     def get_queryset(self):
         """
-        Returns a queryset of offers annotated with:
-        - min_price: lowest price across all offer details
-        - min_delivery_time: shortest delivery time across all offer details
+        Returns a queryset of offers.
+
+        min_price and min_delivery_time are stored on the offer itself,
+        so filtering and ordering by them can use their indexes.
+        Details and the owner's profile are loaded in bulk, so a page
+        is served with a fixed number of queries.
 
         Optional query parameters:
         - creator_id: filter offers by owner
         - min_price: filter offers with minimum price >= value
         - max_delivery_time: filter offers with delivery time <= value
         """
-        queryset = Offer.objects.all().annotate(
-            min_price=Min('details__price'),
-            min_delivery_time=Min('details__delivery_time_in_days')
+        queryset = Offer.objects.select_related(
+            'owner__profile'
+        ).prefetch_related(
+            'details'
         )
 
         creator_id = self.request.query_params.get('creator_id')
@@ -90,6 +125,31 @@ class OffersView(ListCreateAPIView):
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the offers list from the response cache when possible.
+
+        Entries are keyed by the normalized query string and depend on the
+        offers collection and on the profiles of the owners they show.
+        The X-Cache header reports whether the response was a HIT or MISS.
+        """
+        key = offer_cache.list_key(request)
+        data = offer_cache.get_response(key)
+        if data is not None:
+            return Response(data, headers={'X-Cache': 'HIT'})
+
+        tag_versions = offer_cache.get_tag_versions([offer_cache.OFFERS_TAG])
+        response = super().list(request, *args, **kwargs)
+
+        results = response.data.get('results', []) if isinstance(response.data, dict) else response.data
+        tag_versions.update(offer_cache.get_tag_versions(
+            {offer_cache.owner_tag(offer['user']) for offer in results}
+        ))
+        offer_cache.set_response(key, response.data, tag_versions)
+
+        response['X-Cache'] = 'MISS'
+        return response
+
     def post(self, request):
         """
         Creates a new offer.
@@ -107,6 +167,52 @@ class OffersView(ListCreateAPIView):
 
         return Response(serializer.data, status=201)
     
+class OfferBulkCreateView(APIView):
+    """
+    Creates many offers of the authenticated business user in one request.
+
+    - POST:
+      Accepts a JSON list of offers in the same format as POST /api/offers/.
+      All offers are validated first; if any is invalid, nothing is created
+      and the errors are returned per item (in request order). Otherwise
+      all offers, details and features are inserted in a single transaction.
+    """
+    permission_classes = [IsAuthenticated]
+    max_offers = 500
+
+    def post(self, request):
+        """
+        Returns one result per offer with its index, ID, title and details.
+        """
+        if request.user.type != 'business':
+            return Response(
+                {"detail": "Only business users can create offers."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = OffersSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.max_offers,
+            context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
+        offers = serializer.save()
+
+        return Response([
+            {
+                "index": index,
+                "id": offer.id,
+                "title": offer.title,
+                "details": [
+                    {"id": detail.id, "offer_type": detail.offer_type}
+                    for detail in offer.bulk_details
+                ],
+            }
+            for index, offer in enumerate(offers)
+        ], status=status.HTTP_201_CREATED)
+
+
 class OfferDetailView(APIView):
     """
     Handles retrieve, update and deletion of a single offer.
@@ -114,12 +220,39 @@ class OfferDetailView(APIView):
     def get(self, request, pk):
         """
         Returns basic information about a single offer identified by its ID.
+
+        Responses are served from the response cache until the offer or
+        one of its details changes. Conditional requests are answered with
+        304 Not Modified after a single query for updated_at and version.
         """
-        offer = get_object_or_404(Offer, pk=pk)
+        state = Offer.objects.filter(pk=pk).values('updated_at', 'version').first()
+        if state is None:
+            raise Http404
+        etag, last_modified = get_offer_validators('o', pk, state['updated_at'], state['version'])
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return set_validators(not_modified, etag, last_modified)
+
+        key = offer_cache.detail_key(pk)
+        data = offer_cache.get_response(key)
+        if data is not None:
+            response = Response(data, headers={'X-Cache': 'HIT'})
+            return set_validators(response, etag, last_modified)
+
+        tag_versions = offer_cache.get_tag_versions([offer_cache.offer_tag(pk)])
+        offer = get_object_or_404(
+            Offer.objects.prefetch_related('details'),
+            pk=pk
+        )
 
         serializer = OfferPrimaryKeySerializer(offer)
+        offer_cache.set_response(key, serializer.data, tag_versions)
 
-        return Response(serializer.data)
+        response = Response(serializer.data, headers={'X-Cache': 'MISS'})
+        return set_validators(response, etag, last_modified)
     
     def patch(self, request, pk):
         """
@@ -129,7 +262,7 @@ class OfferDetailView(APIView):
         """
         offer = get_object_or_404(Offer, pk=pk)
 
-        if offer.owner != request.user:
+        if offer.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to edit this offer."},
                 status=status.HTTP_403_FORBIDDEN
@@ -153,7 +286,7 @@ class OfferDetailView(APIView):
         """
         offer = get_object_or_404(Offer, pk=pk)
         
-        if offer.owner != request.user:
+        if offer.owner_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to delete this offer."},
                 status=status.HTTP_403_FORBIDDEN
@@ -171,7 +304,25 @@ class AllDetailsForOfferView(APIView):
     def get(self, request, pk):
         """
         Retrieves a single OfferDetail including all related information.
+
+        Conditional requests are answered with 304 Not Modified after a
+        single query for the parent offer's updated_at and version.
         """
+        state = OfferDetail.objects.filter(pk=pk).values(
+            'offer__updated_at', 'offer__version'
+        ).first()
+        if state is None:
+            raise Http404
+        etag, last_modified = get_offer_validators(
+            'd', pk, state['offer__updated_at'], state['offer__version']
+        )
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return set_validators(not_modified, etag, last_modified)
+
         offer_detail = get_object_or_404(OfferDetail, pk=pk)
         serializer = AllDetailsForOfferSerializer(offer_detail)
-        return Response(serializer.data)
\ No newline at end of file
+        return set_validators(Response(serializer.data), etag, last_modified)
\ No newline at end of file
@@ -0,0 +1,111 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import urlencode
+
+CACHE_PREFIX = 'offers'
+CACHE_TIMEOUT = getattr(settings, 'OFFER_CACHE_TIMEOUT', 300)
+
+OFFERS_TAG = 'offers'
+
+
+def offer_tag(offer_id):
+    return f'offer:{offer_id}'
+
+
+def owner_tag(user_id):
+    return f'owner:{user_id}'
+
+
+def _tag_key(tag):
+    return f'{CACHE_PREFIX}:tag:{tag}'
+
+
+def _response_key(*parts):
+    digest = hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'{CACHE_PREFIX}:response:{digest}'
+
+
+def list_key(request):
+    """
+    Cache key for the offers list.
+
+    Query parameters are normalized (sorted, empty values dropped), so
+    equivalent query strings share one entry. The host is part of the key
+    because paginated responses contain absolute next/previous links.
+    """
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+        if value != ''
+    )
+    return _response_key('list', request.get_host(), urlencode(params))
+
+
+def detail_key(offer_id):
+    """
+    Cache key for a single offer.
+    """
+    return _response_key('detail', offer_id)
+
+
+def get_tag_versions(tags):
+    """
+    Return the current version of every tag.
+
+    Missing tags are initialized with a time-based version, so a tag that
+    was evicted from the cache never comes back with a version an old
+    entry was stored with.
+    """
+    keys = {_tag_key(tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+
+    for key in keys.keys() - versions.keys():
+        cache.add(key, time.time_ns(), timeout=None)
+        versions[key] = cache.get(key)
+
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def get_response(key):
+    """
+    Return cached response data, or None when the entry is missing or one
+    of the tags it depends on has been invalidated since it was stored.
+    """
+    entry = cache.get(key)
+
+    if entry is not None and get_tag_versions(entry['tags']) == entry['tags']:
+        return entry['data']
+    return None
+
+
+def set_response(key, data, tag_versions):
+    """
+    Store response data together with the tag versions it was built from.
+
+    Callers should read the versions of the tags they already know before
+    building the data, so a concurrent invalidation is never masked.
+    """
+    cache.set(key, {'data': data, 'tags': tag_versions}, CACHE_TIMEOUT)
+
+
+def invalidate(*tags):
+    """
+    Invalidate every cached response depending on one of the tags.
+
+    Runs after the surrounding transaction commits, so readers cannot
+    cache data from before the write under the new version.
+    """
+    def bump():
+        for tag in tags:
+            try:
+                cache.incr(_tag_key(tag))
+            except ValueError:
+                cache.set(_tag_key(tag), time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
+
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the stored min_price and min_delivery_time of every offer
+    from its details.
+
+    Offers are processed in primary key ranges so that each UPDATE only
+    touches a bounded number of rows.
+    """
+    help = "Backfill Offer.min_price and Offer.min_delivery_time from the offer details."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of offers updated per statement (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = Offer.objects.order_by('-pk').values_list('pk', flat=True).first()
+
+        if last_id is None:
+            self.stdout.write("No offers found.")
+            return
+
+        updated = 0
+        for start in range(0, last_id + 1, batch_size):
+            updated += Offer.objects.filter(
+                pk__gte=start,
+                pk__lt=start + batch_size
+            ).refresh_min_values()
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} offers."))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_offer_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_price'], name='offer_min_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_delivery_time'], name='offer_min_delivery_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['-updated_at'], name='offer_updated_at_idx'),
+        ),
+    ]
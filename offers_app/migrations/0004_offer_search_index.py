@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from core.search import FullTextIndex
+
+
+offer_search_index = FullTextIndex('offers_app_offer', ['title', 'description'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_offer_min_delivery_time_offer_min_price_and_more'),
+    ]
+
+    operations = [
+        offer_search_index.create_operation(),
+    ]
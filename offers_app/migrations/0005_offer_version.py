@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:06
+
+from django.db import migrations, models
+
+from core.search import FullTextIndex
+
+
+offer_search_index = FullTextIndex('offers_app_offer', ['title', 'description'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0004_offer_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        # SQLite rebuilds the table for this column and drops its triggers.
+        offer_search_index.restore_triggers_operation(),
+    ]
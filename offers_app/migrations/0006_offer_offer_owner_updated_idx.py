@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_offer_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['owner', '-updated_at'], name='offer_owner_updated_idx'),
+        ),
+    ]
@@ -1,5 +1,50 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F, Min, OuterRef, Subquery
+from django.utils import timezone
+
+
+class OfferQuerySet(models.QuerySet):
+    """
+    Custom queryset for offers.
+    """
+
+    def refresh_min_values(self, **changes):
+        """
+        Recompute the stored min_price and min_delivery_time of all offers
+        in this queryset from their details with a single UPDATE statement.
+        Additional column updates passed as keyword arguments are applied
+        in the same statement.
+
+        Returns the number of updated offers.
+        """
+        details = OfferDetail.objects.filter(
+            offer=OuterRef('pk')
+        ).order_by().values('offer')
+
+        return self.update(
+            min_price=Subquery(
+                details.annotate(value=Min('price')).values('value')
+            ),
+            min_delivery_time=Subquery(
+                details.annotate(value=Min('delivery_time_in_days')).values('value')
+            ),
+            **changes,
+        )
+
+    def mark_details_changed(self, min_values=True):
+        """
+        Record that the details or features of the offers changed:
+        refresh the stored min values, increment version and set
+        updated_at, all in a single UPDATE statement.
+
+        Pass min_values=False when no price or delivery time changed,
+        to skip the min value subqueries.
+        """
+        changes = {'version': F('version') + 1, 'updated_at': timezone.now()}
+        if min_values:
+            return self.refresh_min_values(**changes)
+        return self.update(**changes)
 
 
 class Offer(models.Model):
@@ -13,6 +58,9 @@ class Offer(models.Model):
     - image: Optional image representing the offer.
     - created_at: Timestamp when the offer was created.
     - updated_at: Timestamp when the offer was last updated.
+    - min_price: Lowest price across all details (kept in sync with the details).
+    - min_delivery_time: Shortest delivery time across all details (kept in sync with the details).
+    - version: Incremented whenever the details or features change (used for ETags).
     """
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -26,6 +74,25 @@ class Offer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    min_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True
+    )
+    min_delivery_time = models.PositiveIntegerField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=0)
+
+    objects = OfferQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['min_price'], name='offer_min_price_idx'),
+            models.Index(fields=['min_delivery_time'], name='offer_min_delivery_idx'),
+            models.Index(fields=['-updated_at'], name='offer_updated_at_idx'),
+            models.Index(fields=['owner', '-updated_at'], name='offer_owner_updated_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
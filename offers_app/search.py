@@ -0,0 +1,3 @@
+from core.search import FullTextIndex
+
+offer_search_index = FullTextIndex('offers_app_offer', ['title', 'description'])
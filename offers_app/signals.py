@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from offers_app import cache as offer_cache
+from offers_app.models import Offer, OfferDetail
+from platform_app.dashboard import invalidate_dashboard
+from profile_app.models import Profile
+
+
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_min_values_on_detail_delete(sender, instance, **kwargs):
+    """
+    Keep the stored min_price, min_delivery_time and version of the parent
+    offer correct after one of its details has been deleted. Skipped when
+    the details are deleted together with their offer.
+
+    The UPDATE sends no signal, so the owner's dashboard (which shows the
+    lowest offer price) is invalidated here.
+    """
+    if isinstance(kwargs.get('origin'), Offer):
+        return
+    offer = Offer.objects.filter(pk=instance.offer_id)
+    offer.mark_details_changed()
+    owner_id = offer.values_list('owner_id', flat=True).first()
+    if owner_id is not None:
+        invalidate_dashboard(owner_id)
+
+
+@receiver([post_save, post_delete], sender=Offer)
+def invalidate_cache_on_offer_write(sender, instance, **kwargs):
+    """
+    Any offer write can change list membership and ordering, so every
+    list entry and the entry of the offer itself are evicted.
+    """
+    offer_cache.invalidate(offer_cache.OFFERS_TAG, offer_cache.offer_tag(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=OfferDetail)
+def invalidate_cache_on_detail_write(sender, instance, **kwargs):
+    """
+    Details drive min_price/min_delivery_time filters and ordering, so
+    every list entry and the entry of the parent offer are evicted.
+    """
+    offer_cache.invalidate(offer_cache.OFFERS_TAG, offer_cache.offer_tag(instance.offer_id))
+
+
+# OfferFeature writes have no receiver on purpose: neither the cached
+# offers list nor the cached single-offer response contains features
+# (details are rendered as id and url only). Features are only shown by
+# /api/offerdetails/<id>/, which is not cached; its ETag follows
+# Offer.version, so feature edits outside the offer serializers must call
+# mark_details_changed() on the offer (the admin does).
+
+
+@receiver([post_save, post_delete], sender=Profile)
+def invalidate_cache_on_profile_write(sender, instance, **kwargs):
+    """
+    The owner's profile is embedded in list entries showing their offers.
+    """
+    offer_cache.invalidate(offer_cache.owner_tag(instance.user_id))
@@ -1,3 +1,433 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from auth_app.models import User
+from offers_app.admin import OfferFeatureExtension
+from offers_app.api.views import OfferBulkCreateView
+from offers_app.models import Offer, OfferDetail, OfferFeature
+from platform_app.models import PlatformCounters
+from profile_app.models import Profile
+
+
+def create_offer(owner, title="Offer", prices=(100, 200, 300)):
+    """
+    Create an offer with one detail per offer type, mirroring what
+    OffersSerializer.create stores.
+    """
+    offer = Offer.objects.create(owner=owner, title=title, description="Description")
+
+    for offer_type, price in zip(("basic", "standard", "premium"), prices):
+        detail = OfferDetail.objects.create(
+            offer=offer,
+            title=f"{title} {offer_type}",
+            offer_type=offer_type,
+            revisions=1,
+            delivery_time_in_days=price // 100,
+            price=price,
+        )
+        OfferFeature.objects.create(detail=detail, name="Feature")
+
+    Offer.objects.filter(pk=offer.pk).refresh_min_values()
+    return offer
+
+
+class OfferListQueryCountTests(APITestCase):
+    """
+    The public offers list must not issue additional queries per offer.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        for index in range(3):
+            owner = User.objects.create_user(
+                username=f"business{index}",
+                password="password",
+                type="business",
+            )
+            Profile.objects.create(user=owner)
+
+            for offer_index in range(4):
+                create_offer(owner, title=f"Offer {index}-{offer_index}")
+
+    def count_list_queries(self, page_size):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/offers/', {'page_size': page_size})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), page_size)
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self.assertEqual(self.count_list_queries(1), self.count_list_queries(10))
+
+    def test_list_returns_stored_min_values(self):
+        response = self.client.get('/api/offers/', {'page_size': 1})
+
+        offer = response.data['results'][0]
+        self.assertEqual(offer['min_price'], 100)
+        self.assertEqual(offer['min_delivery_time'], 1)
+        self.assertEqual(len(offer['details']), 3)
+
+
+class OfferConditionalGetTests(APITestCase):
+    """
+    304 responses must repeat the validators of the full response.
+    """
+
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username="business", password="password", type="business")
+        self.offer = create_offer(owner)
+        self.client.force_authenticate(owner)
+
+    def assert_not_modified_keeps_validators(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        self.assertEqual(not_modified['Last-Modified'], response['Last-Modified'])
+
+    def test_offer_detail(self):
+        self.assert_not_modified_keeps_validators(f'/api/offers/{self.offer.id}/')
+
+    def test_offer_detail_tier(self):
+        detail = self.offer.details.first()
+        self.assert_not_modified_keeps_validators(f'/api/offerdetails/{detail.id}/')
+
+
+class OfferKeysetPaginationTests(APITestCase):
+    """
+    Cursor pages must walk every offer exactly once in both directions,
+    also across ties on the ordering value, and seek to the cursor
+    position through the index.
+    """
+
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username="business", password="password", type="business")
+        for index, price in enumerate((300, 100, 200, 100, 100, 200, 50)):
+            create_offer(owner, title=f"Offer {index}", prices=(price, price + 100, price + 200))
+        Offer.objects.filter(min_price=100).update(updated_at=timezone.now())
+
+    def walk(self, ordering):
+        response = self.client.get(
+            '/api/offers/', {'pagination': 'cursor', 'ordering': ordering, 'page_size': 2}
+        )
+        pages = [[offer['id'] for offer in response.data['results']]]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            pages.append([offer['id'] for offer in response.data['results']])
+
+        backwards = [pages[-1]]
+        while response.data['previous']:
+            response = self.client.get(response.data['previous'])
+            backwards.append([offer['id'] for offer in response.data['results']])
+        return pages, backwards[::-1]
+
+    def assert_walks(self, ordering, key):
+        expected = [offer.id for offer in sorted(Offer.objects.all(), key=key)]
+
+        pages, backwards = self.walk(ordering)
+
+        self.assertEqual([offer_id for page in pages for offer_id in page], expected)
+        self.assertEqual(backwards, pages)
+
+    def test_walk_by_min_price_across_ties(self):
+        self.assert_walks('min_price', lambda offer: (offer.min_price, offer.id))
+
+    def test_walk_by_updated_at_across_ties(self):
+        self.assert_walks(
+            '-updated_at', lambda offer: (-offer.updated_at.timestamp(), -offer.id)
+        )
+
+    def test_deep_page_seeks_on_ordering_column(self):
+        first = self.client.get('/api/offers/', {'pagination': 'cursor', 'page_size': 2})
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(first.data['next'])
+
+        sql = next(
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT') and '"offers_app_offer"."updated_at" <' in query['sql']
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertIn('offer_updated_at_idx (updated_at<?)', plan)
+
+
+class OfferResponseCacheTests(APITestCase):
+    """
+    Cached list and single-offer responses are evicted after the writes
+    they depend on.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="business", password="password", type="business")
+        self.profile = Profile.objects.create(user=self.owner)
+        self.offer = create_offer(self.owner)
+        self.list_url = '/api/offers/'
+        self.detail_url = f'/api/offers/{self.offer.id}/'
+        self.client.force_authenticate(self.owner)
+
+    def x_cache(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['X-Cache']
+
+    def warm(self):
+        for url in (self.list_url, self.detail_url):
+            self.x_cache(url)
+            self.assertEqual(self.x_cache(url), 'HIT')
+
+    def test_offer_write_evicts_list_and_offer(self):
+        self.warm()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.detail_url, {'title': 'Renamed'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.x_cache(self.list_url), 'MISS')
+        self.assertEqual(self.x_cache(self.detail_url), 'MISS')
+        self.assertEqual(self.client.get(self.detail_url).data['title'], 'Renamed')
+
+    def test_detail_write_evicts_list_and_offer(self):
+        self.warm()
+        detail = self.offer.details.first()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            detail.price = 10
+            detail.save()
+
+        self.assertEqual(self.x_cache(self.list_url), 'MISS')
+        self.assertEqual(self.x_cache(self.detail_url), 'MISS')
+
+    def test_profile_write_evicts_list_only(self):
+        self.warm()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.first_name = 'Ada'
+            self.profile.save()
+
+        self.assertEqual(self.x_cache(self.list_url), 'MISS')
+        self.assertEqual(self.x_cache(self.detail_url), 'HIT')
+
+    def test_admin_feature_write_changes_offer_version(self):
+        feature = OfferFeature.objects.filter(detail__offer=self.offer).first()
+        version = Offer.objects.get(pk=self.offer.pk).version
+
+        feature.name = 'Renamed'
+        OfferFeatureExtension(OfferFeature, admin.site).save_model(None, feature, None, True)
+
+        self.assertEqual(Offer.objects.get(pk=self.offer.pk).version, version + 1)
+
+
+def offer_payload(title, prices=(100, 200, 300)):
+    return {
+        'title': title,
+        'description': f'{title} description',
+        'details': [
+            {
+                'title': f'{title} {offer_type}',
+                'revisions': 1,
+                'delivery_time_in_days': price // 100,
+                'price': price,
+                'features': ['Logo', 'Source files'],
+                'offer_type': offer_type,
+            }
+            for offer_type, price in zip(('basic', 'standard', 'premium'), prices)
+        ],
+    }
+
+
+class OfferBulkCreateTests(APITestCase):
+    """
+    The bulk import bypasses model saves, so its manual upkeep of counters,
+    search index and caches is checked here.
+    """
+    url = '/api/offers/bulk/'
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="business", password="password", type="business")
+        Profile.objects.create(user=self.owner)
+        self.client.force_authenticate(self.owner)
+
+    def test_invalid_item_rejects_whole_batch(self):
+        invalid = offer_payload('Broken')
+        del invalid['details'][1]['price']
+
+        response = self.client.post(
+            self.url, [offer_payload('Valid'), invalid], format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('price', response.data[1]['details'][1])
+        self.assertFalse(Offer.objects.exists())
+
+    def test_batch_size_is_capped(self):
+        with mock.patch.object(OfferBulkCreateView, 'max_offers', 2):
+            response = self.client.post(
+                self.url, [offer_payload(f'Offer {index}') for index in range(3)], format='json'
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Offer.objects.exists())
+
+    def test_result_per_item(self):
+        response = self.client.post(
+            self.url, [offer_payload('Logo design'), offer_payload('Web design', (50, 60, 70))],
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['index'] for item in response.data], [0, 1])
+        self.assertEqual([item['title'] for item in response.data], ['Logo design', 'Web design'])
+        for item in response.data:
+            offer = Offer.objects.get(pk=item['id'])
+            self.assertEqual(
+                [(detail['id'], detail['offer_type']) for detail in item['details']],
+                list(offer.details.order_by('pk').values_list('id', 'offer_type'))
+            )
+            self.assertEqual(
+                OfferFeature.objects.filter(detail__offer=offer).count(), 6
+            )
+        self.assertEqual(Offer.objects.get(pk=response.data[1]['id']).min_price, 50)
+
+    def test_counters_and_search_index_are_updated(self):
+        create_offer(self.owner, title="Existing")
+        PlatformCounters.recompute()
+
+        self.client.post(
+            self.url, [offer_payload('Unicorn logo'), offer_payload('Unicorn mascot')], format='json'
+        )
+
+        self.assertEqual(PlatformCounters.get().offer_count, Offer.objects.count())
+        response = self.client.get('/api/offers/', {'search': 'unicorn', 'page_size': 10})
+        self.assertEqual(
+            {offer['title'] for offer in response.data['results']},
+            {'Unicorn logo', 'Unicorn mascot'}
+        )
+
+    def test_offers_list_cache_is_invalidated(self):
+        self.client.get('/api/offers/')
+        self.assertEqual(self.client.get('/api/offers/')['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, [offer_payload('Fresh')], format='json')
+
+        response = self.client.get('/api/offers/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], 'Fresh')
+
+
+class OfferPatchDiffTests(APITestCase):
+    """
+    PATCH /api/offers/<id>/ writes only the differences to the stored offer.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="business", password="password", type="business")
+        self.offer = create_offer(self.owner)
+        self.url = f'/api/offers/{self.offer.id}/'
+        self.client.force_authenticate(self.owner)
+
+    def details_payload(self, **changes):
+        details = []
+        for detail in self.offer.details.order_by('pk'):
+            data = {
+                'title': detail.title,
+                'revisions': detail.revisions,
+                'delivery_time_in_days': detail.delivery_time_in_days,
+                'price': int(detail.price),
+                'features': list(detail.features.order_by('pk').values_list('name', flat=True)),
+                'offer_type': detail.offer_type,
+            }
+            data.update(changes.get(detail.offer_type, {}))
+            details.append(data)
+        return details
+
+    def patch(self, payload):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(response.status_code, 200)
+        return [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith(('UPDATE', 'INSERT', 'DELETE'))
+        ]
+
+    def offer_state(self):
+        return Offer.objects.values('updated_at', 'version', 'min_price', 'min_delivery_time').get(
+            pk=self.offer.pk
+        )
+
+    def test_noop_patch_writes_nothing(self):
+        before = self.offer_state()
+
+        writes = self.patch({'title': self.offer.title, 'details': self.details_payload()})
+
+        self.assertEqual(writes, [])
+        self.assertEqual(self.offer_state(), before)
+
+    def test_features_are_added_and_removed_individually(self):
+        basic = self.offer.details.get(offer_type='basic')
+        kept = basic.features.get()
+
+        writes = self.patch({'details': self.details_payload(
+            basic={'features': ['Feature', 'Logo', 'Logo']}
+        )})
+
+        self.assertEqual(len(writes), 2)
+        self.assertTrue(writes[0].startswith('INSERT INTO "offers_app_offerfeature"'))
+        self.assertEqual(
+            sorted(basic.features.values_list('name', flat=True)), ['Feature', 'Logo', 'Logo']
+        )
+        self.assertTrue(basic.features.filter(pk=kept.pk).exists())
+
+        writes = self.patch({'details': self.details_payload(basic={'features': ['Logo']})})
+
+        self.assertTrue(writes[0].startswith('DELETE FROM "offers_app_offerfeature"'))
+        self.assertEqual(list(basic.features.values_list('name', flat=True)), ['Logo'])
+        self.assertFalse(any(sql.startswith('INSERT') for sql in writes))
+
+    def test_single_tier_field_change(self):
+        before = self.offer_state()
+
+        writes = self.patch({'details': self.details_payload(standard={'title': 'Renamed'})})
+
+        detail_updates = [sql for sql in writes if sql.startswith('UPDATE "offers_app_offerdetail"')]
+        self.assertEqual(len(detail_updates), 1)
+        self.assertIn('SET "title"', detail_updates[0])
+        self.assertNotIn('"price"', detail_updates[0])
+        self.assertEqual(self.offer.details.get(offer_type='standard').title, 'Renamed')
+
+        offer_updates = [sql for sql in writes if sql.startswith('UPDATE "offers_app_offer"')]
+        self.assertEqual(len(offer_updates), 1)
+        self.assertNotIn('MIN(', offer_updates[0])
+        after = self.offer_state()
+        self.assertEqual(after['version'], before['version'] + 1)
+        self.assertGreater(after['updated_at'], before['updated_at'])
+
+    def test_min_values_recomputed_on_price_change(self):
+        writes = self.patch({'details': self.details_payload(
+            premium={'price': 40, 'delivery_time_in_days': 9}
+        )})
+
+        offer_updates = [sql for sql in writes if sql.startswith('UPDATE "offers_app_offer"')]
+        self.assertIn('MIN(', offer_updates[0])
+        state = self.offer_state()
+        self.assertEqual(state['min_price'], 40)
+        self.assertEqual(state['min_delivery_time'], 1)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Order, OrderFeature
+from .models import ArchivedOrder, FeatureSnapshot, Order, OrderFeature
 
 class OrderExtension(admin.ModelAdmin):
     list_display = ("id", "customer_user", "business_user", "title", "revisions", "delivery_time_in_days")
@@ -9,3 +9,5 @@ class OrderFeatureExtension(admin.ModelAdmin):
     
 admin.site.register(Order, OrderExtension)
 admin.site.register(OrderFeature, OrderFeatureExtension)
+admin.site.register(FeatureSnapshot)
+admin.site.register(ArchivedOrder, OrderExtension)
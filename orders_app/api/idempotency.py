@@ -0,0 +1,112 @@
+import hashlib
+import json
+import sqlite3
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from orders_app.models import IdempotencyKey
+
+IDEMPOTENCY_KEY_TTL = getattr(settings, 'IDEMPOTENCY_KEY_TTL', timedelta(hours=24))
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(request):
+    """
+    Return a SHA-256 hash of the request body.
+    """
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def is_lock_error(error):
+    """
+    Return whether an OperationalError means the database stayed locked by
+    another transaction (SQLITE_BUSY / SQLITE_LOCKED), as opposed to e.g. a
+    missing table or an I/O error.
+    """
+    code = getattr(error.__cause__, 'sqlite_errorcode', None)
+    if code is not None:
+        return code & 0xff in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return 'database is locked' in str(error) or 'database table is locked' in str(error)
+
+
+def replay(record, fingerprint):
+    """
+    Build the response for a request whose key has already been used.
+    """
+    if record.request_hash != fingerprint:
+        return Response(
+            {"detail": "This Idempotency-Key was already used for a different request."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    return Response(
+        record.response_body,
+        status=record.response_status,
+        headers={'Idempotent-Replayed': 'true'}
+    )
+
+
+def idempotent_response(request, key, handler):
+    """
+    Run handler() at most once per (user, key) and return its response.
+
+    The key row is inserted in the same transaction as the handler's
+    writes. A concurrent request with the same key blocks on the unique
+    constraint until that transaction ends and then replays the stored
+    response. If the handler raises (e.g. a validation error), nothing
+    is stored and the key can be retried.
+
+    If the database stays locked by the concurrent transaction beyond its
+    busy timeout, 503 Service Unavailable is returned; nothing was stored,
+    so the client can retry with the same key. Other database errors are
+    re-raised.
+    """
+    if len(key) > MAX_KEY_LENGTH:
+        return Response(
+            {"detail": f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    fingerprint = request_fingerprint(request)
+    now = timezone.now()
+
+    record = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+    if record is not None:
+        if record.expires_at > now:
+            return replay(record, fingerprint)
+        record.delete()
+
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=request.user,
+                key=key,
+                request_hash=fingerprint,
+                expires_at=now + IDEMPOTENCY_KEY_TTL,
+            )
+            response = handler()
+
+            record.response_status = response.status_code
+            record.response_body = response.data
+            record.save(update_fields=['response_status', 'response_body'])
+    except IntegrityError:
+        # Without a stored row the error came from the handler itself.
+        record = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+        if record is None:
+            raise
+        return replay(record, fingerprint)
+    except OperationalError as error:
+        if not is_lock_error(error):
+            raise
+        return Response(
+            {"detail": "The database is busy. Retry the request with the same Idempotency-Key."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={'Retry-After': '1'}
+        )
+
+    return response
@@ -0,0 +1,16 @@
+from core.pagination import KeysetPagination
+
+
+class OrderCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the orders list.
+
+    Supports ordering by created_at, updated_at and price with the order ID
+    as tie-breaker, so every page costs the same regardless of how many
+    orders a user has.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_fields = ('created_at', 'updated_at', 'price')
+    default_ordering = '-created_at'
@@ -1,6 +1,37 @@
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
-from orders_app.models import Order, OrderFeature
+from orders_app.models import FeatureSnapshot, Order
 from offers_app.models import OfferDetail
+from core.fields import ForeignKeyIdField
+
+
+def get_order_features(order):
+    """
+    Return the feature names of an order.
+
+    Reads the shared snapshot; orders that have not been migrated by
+    `manage.py migrate_order_features` fall back to their OrderFeature rows.
+    """
+    if order.feature_snapshot_id is not None:
+        return list(order.feature_snapshot.names)
+    return [feature.name for feature in order.order_features.all()]
+
+
+class OrderListSerializer(serializers.ListSerializer):
+    """
+    Loads the legacy OrderFeature rows in one query, and only for the
+    orders that do not reference a feature snapshot yet.
+    """
+
+    def to_representation(self, data):
+        orders = list(data.all() if hasattr(data, 'all') else data)
+        prefetch_related_objects(
+            [order for order in orders if order.feature_snapshot_id is None],
+            'order_features'
+        )
+        return super().to_representation(orders)
+
 
 class OrderSerializer(serializers.ModelSerializer):
     """
@@ -10,21 +41,16 @@ class OrderSerializer(serializers.ModelSerializer):
     - Accepts an `offer_detail_id` to create an order from an OfferDetail
     - Automatically sets customer and business users
     - Copies relevant data from the related OfferDetail
-    - Attaches all selected features to the order
+    - References the feature names through a shared FeatureSnapshot
     """
     offer_detail_id = serializers.IntegerField(write_only=True)
     price = serializers.IntegerField(read_only=True)
-    customer_user = serializers.IntegerField(
-        source='customer_user.id',
-        read_only=True
-    )
-    business_user = serializers.IntegerField(
-        source='business_user.id',
-        read_only=True
-    )
+    customer_user = ForeignKeyIdField()
+    business_user = ForeignKeyIdField()
     features = serializers.SerializerMethodField()
     class Meta:
         model = Order
+        list_serializer_class = OrderListSerializer
         fields = [
             'id',
             'offer_detail_id',
@@ -62,7 +88,7 @@ class OrderSerializer(serializers.ModelSerializer):
         """
         try:
             return OfferDetail.objects.select_related(
-                'offer__owner'
+                'offer'
             ).prefetch_related(
                 'features'
             ).get(pk=value)
@@ -74,11 +100,12 @@ class OrderSerializer(serializers.ModelSerializer):
     def get_features(self, obj):
         """
         Return a list of feature names associated with the order.
+
+        List views load feature_snapshot with select_related.
         """
-        return list(
-            obj.order_features.values_list('name', flat=True)
-        )
+        return get_order_features(obj)
 
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create a new Order instance.
@@ -87,30 +114,27 @@ class OrderSerializer(serializers.ModelSerializer):
         - Assigns the offer owner as business user
         - Copies offer detail values into the order
         - Automatically sets order status to 'in_progress'
-        - Copies all features from OfferDetail into OrderFeature
+        - Stores the OfferDetail feature names as a shared FeatureSnapshot
         """
         request = self.context['request']
         offer_detail = validated_data.pop('offer_detail_id')
 
+        feature_snapshot = FeatureSnapshot.for_names(
+            feature.name for feature in offer_detail.features.all()
+        )
+
         order = Order.objects.create(
             customer_user=request.user,
-            business_user=offer_detail.offer.owner,
+            business_user_id=offer_detail.offer.owner_id,
             title=offer_detail.title,
             revisions=offer_detail.revisions,
             delivery_time_in_days=offer_detail.delivery_time_in_days,
             price=offer_detail.price,
             offer_type=offer_detail.offer_type,
             status='in_progress',
+            feature_snapshot=feature_snapshot,
         )
 
-        OrderFeature.objects.bulk_create([
-            OrderFeature(
-                features=order,
-                name=feature.name
-            )
-            for feature in offer_detail.features.all()
-        ])
-
         return order
 
 
@@ -128,9 +152,7 @@ class OrderDetailsWithPrimaryKeySerializer(serializers.ModelSerializer):
         """
         Return a list of feature names associated with the order.
         """
-        return list(
-            obj.order_features.values_list('name', flat=True)
-        )
+        return get_order_features(obj)
     class Meta:
         model = Order
         fields = [
@@ -146,4 +168,16 @@ class OrderDetailsWithPrimaryKeySerializer(serializers.ModelSerializer):
             'status',
             'created_at',
             'updated_at',
-        ]
\ No newline at end of file
+        ]
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Validates a bulk status change: a list of order IDs and the target status.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000
+    )
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
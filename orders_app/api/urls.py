@@ -1,9 +1,13 @@
 from django.urls import path
-from orders_app.api.views import OrdersView, OrderDetailView, OrderInProgressCountView, OrderCompletedCountView
+from orders_app.api.views import OrdersView, OrderDetailView, OrderBulkStatusView, OrderExportView, OrderInProgressCountView, OrderCompletedCountView, OrderStatusSummaryView
 
 urlpatterns = [
     path('orders/', OrdersView.as_view(), name='order-list-create'),
     path('orders/<int:pk>/', OrderDetailView.as_view(), name='order-detail'),
+    path('orders/bulk-status/', OrderBulkStatusView.as_view(), name='order-bulk-status'),
+    path('orders/export/', OrderExportView.as_view(), name='order-export'),
     path('order-count/<int:pk>/', OrderInProgressCountView.as_view(), name='order-count-in-progress-detail'),
     path('completed-order-count/<int:pk>/', OrderCompletedCountView.as_view(), name='order-count-complete-detail'),
+    path('order-status-summary/', OrderStatusSummaryView.as_view(), name='order-status-summary-list'),
+    path('order-status-summary/<int:pk>/', OrderStatusSummaryView.as_view(), name='order-status-summary-detail'),
 ]
\ No newline at end of file
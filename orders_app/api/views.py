@@ -1,55 +1,183 @@
+from datetime import datetime, time
+
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from .serializers import OrderSerializer, OrderDetailsWithPrimaryKeySerializer
-from rest_framework import status
+from rest_framework.generics import ListCreateAPIView
+from .serializers import OrderSerializer, OrderDetailsWithPrimaryKeySerializer, OrderBulkStatusSerializer
+from .pagination import OrderCursorPagination
+from .idempotency import idempotent_response
+from rest_framework import filters, serializers, status
 from django.shortcuts import get_object_or_404, get_list_or_404
 from rest_framework.response import Response
-from orders_app.models import Order
+from orders_app.models import ArchivedOrder, Order
+from orders_app.export import EXPORT_FORMATS, iter_export
+from platform_app.dashboard import invalidate_dashboard
 from auth_app.models import User
-from django.db.models import Q
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.db.models import Q, Count
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from core.pagination import CappedListPagination, OptionalKeysetPaginationMixin
+from core.streaming import StreamingListMixin
 
 
-class OrdersView(APIView):
+class OrdersView(StreamingListMixin, OptionalKeysetPaginationMixin, ListCreateAPIView):
     """
     Handles listing and creation of orders.
 
     - GET:
-      Returns all orders that belong to the authenticated customer or business user.
+      Returns the orders that belong to the authenticated customer or business user.
       Only users of type 'customer' or 'business' are allowed to access this endpoint.
+      Supports:
+        - filtering by status, role (customer, business) and
+          created_at range (created_after, created_before)
+        - ordering (created_at, updated_at, price), newest first by default
+        - `?pagination=cursor` for keyset pagination with next/previous cursors;
+          without it, the first 100 matching orders are returned as a plain
+          list (with an `X-Truncated: true` header when there are more)
+        - `?stream=true` to stream all matching orders as a JSON array
+          with bounded memory
+        - `?archived=true` to read archived (closed, older) orders instead
+          of the live ones
 
     - POST:
       Allows only customer users to create a new order.
       The order is automatically associated with the authenticated customer.
+      An optional Idempotency-Key header makes retries safe: a repeated key
+      returns the stored response instead of creating another order.
     """
     permission_classes = [IsAuthenticated]
+    serializer_class = OrderSerializer
+    pagination_class = CappedListPagination
+    keyset_pagination_class = OrderCursorPagination
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['created_at', 'updated_at', 'price']
+    ordering = ['-created_at']
 
-    def get(self, request):
+    def get_queryset(self):
+        """
+        Returns the orders of the authenticated user with their feature
+        snapshots loaded in the same query.
+
+        Optional query parameters:
+        - status: in_progress, completed or cancelled
+        - role: customer (orders placed) or business (orders received)
+        - created_after / created_before: ISO date or datetime bounds (inclusive)
+        - archived: true to read from the archive table instead
+        """
+        user = self.request.user
+        params = self.request.query_params
+
+        model = ArchivedOrder if self.wants_archived() else Order
+
+        role = params.get('role')
+        if role == 'customer':
+            queryset = model.objects.filter(customer_user=user)
+        elif role == 'business':
+            queryset = model.objects.filter(business_user=user)
+        elif role:
+            raise serializers.ValidationError({
+                "role": "Must be 'customer' or 'business'."
+            })
+        else:
+            queryset = model.objects.filter(
+                Q(customer_user=user) |
+                Q(business_user=user)
+            )
+
+        order_status = params.get('status')
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise serializers.ValidationError({
+                    "status": "Must be one of: in_progress, completed, cancelled."
+                })
+            queryset = queryset.filter(status=order_status)
+
+        for param, lookup in (('created_after', 'gte'), ('created_before', 'lte')):
+            value = params.get(param)
+            if value:
+                queryset = queryset.filter(
+                    **{f'created_at__{lookup}': self.parse_created_at(param, value, lookup)}
+                )
+
+        return queryset.select_related('feature_snapshot')
+
+    def wants_archived(self):
+        return self.request.query_params.get('archived', '').lower() in ('1', 'true')
+
+    def parse_created_at(self, param, value, lookup):
+        """
+        Parse a created_at bound. A plain date covers the whole day;
+        values without a time zone are interpreted in the current time zone.
+        """
+        try:
+            # parse_datetime() also accepts a plain date (as midnight), so
+            # dates are checked first.
+            parsed_date = parse_date(value)
+            if parsed_date is not None:
+                parsed = datetime.combine(parsed_date, time.min if lookup == 'gte' else time.max)
+            else:
+                parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+
+        if parsed is None:
+            raise serializers.ValidationError({
+                param: "Must be an ISO 8601 date or datetime."
+            })
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def list(self, request, *args, **kwargs):
         """
-        Retrieve all orders for the authenticated user.
+        Retrieve the orders for the authenticated user.
 
         Returns:
-            200 OK: A list of orders belonging to the authenticated customer.
+            200 OK: A capped list (or a cursor page) of orders.
+            400 Bad Request: If a filter value is invalid.
             403 Forbidden: If the user type is not customer or business.
-            404 Not Found: If no orders exist for the user.
+            404 Not Found: If no orders exist for the user (unpaginated list only).
         """
         if request.user.type not in ['customer', 'business']:
             return Response({"detail": "Only customer or business users are allowed."},status=403)
 
-        orders = Order.objects.filter(
-            Q(customer_user=request.user) |
-            Q(business_user=request.user)
-        )
+        if self.wants_stream(request):
+            return self.stream_response(
+                self.filter_queryset(self.get_queryset()),
+                self.get_serializer_class(),
+                context=self.get_serializer_context()
+            )
 
-        if not orders.exists():
+        response = super().list(request, *args, **kwargs)
+
+        if not self.use_keyset_pagination() and not response.data:
             return Response(
                 {"detail": "No orders found for this user."},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = OrderSerializer(orders, many=True)
-        return Response(serializer.data)
+        return response
 
     def post(self, request):
+        """
+        Create a new order, at most once per Idempotency-Key header value.
+
+        Returns:
+            The response of create_order, or the stored response for a
+            repeated key (with an Idempotent-Replayed header).
+            422 Unprocessable Entity: If the key was used with another body.
+            503 Service Unavailable: If the database stayed locked by a
+                concurrent request; retrying with the same key is safe.
+        """
+        key = request.headers.get('Idempotency-Key')
+        if key:
+            return idempotent_response(request, key, lambda: self.create_order(request))
+        return self.create_order(request)
+
+    def create_order(self, request):
         """
         Create a new order.
 
@@ -120,7 +248,7 @@ class OrderDetailView(APIView):
         request_data = request.data.copy()
         order = get_object_or_404(Order, pk=pk)
 
-        if order.business_user != request.user:
+        if order.business_user_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to edit this order."},
                 status=status.HTTP_403_FORBIDDEN)
@@ -138,6 +266,117 @@ class OrderDetailView(APIView):
 
         return Response(serializer.data)
     
+class OrderBulkStatusView(APIView):
+    """
+    Changes the status of many orders of the authenticated business user.
+
+    - POST:
+      Accepts {"ids": [...], "status": "..."} with up to 1000 order IDs.
+      Ownership is checked with one query and all owned orders are changed
+      with one conditional UPDATE. Orders that cannot be changed do not
+      stop the others; the response reports the outcome per ID.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Returns:
+            200 OK: {status, updated, results: [{id, result}]} where result is
+                    'updated', 'unchanged' (already in the target status),
+                    'forbidden' (order of another business user) or 'not_found'.
+            400 Bad Request: If the IDs or the status are invalid.
+            403 Forbidden: If the user is not a business user.
+        """
+        if request.user.type != 'business':
+            return Response(
+                {"detail": "Only business users can update orders."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        order_ids = list(dict.fromkeys(serializer.validated_data['ids']))
+        target_status = serializer.validated_data['status']
+
+        with transaction.atomic():
+            orders = {
+                order['id']: order
+                for order in Order.objects.select_for_update().filter(
+                    pk__in=order_ids
+                ).values('id', 'business_user_id', 'status')
+            }
+            results = {}
+            for order_id in order_ids:
+                order = orders.get(order_id)
+                if order is None:
+                    results[order_id] = 'not_found'
+                elif order['business_user_id'] != request.user.id:
+                    results[order_id] = 'forbidden'
+                elif order['status'] == target_status:
+                    results[order_id] = 'unchanged'
+                else:
+                    results[order_id] = 'updated'
+
+            updated = Order.objects.filter(
+                pk__in=[order_id for order_id, result in results.items() if result == 'updated'],
+                business_user=request.user
+            ).exclude(
+                status=target_status
+            ).update(status=target_status, updated_at=timezone.now())
+            if updated:
+                invalidate_dashboard(request.user.id)
+
+        return Response({
+            'status': target_status,
+            'updated': updated,
+            'results': [
+                {'id': order_id, 'result': result}
+                for order_id, result in results.items()
+            ],
+        })
+
+class OrderExportView(APIView):
+    """
+    Streams the complete order history (live and archived orders with
+    their features) of the authenticated business user.
+
+    - GET /api/orders/export/?export_format=csv|ndjson (default csv):
+      Rows are read in chunks and written to the response as they are
+      produced, so memory use stays constant regardless of the export size.
+      For very large exports use `manage.py export_orders --workers N`.
+    """
+    permission_classes = [IsAuthenticated]
+    content_types = {
+        'csv': 'text/csv; charset=utf-8',
+        'ndjson': 'application/x-ndjson; charset=utf-8',
+    }
+
+    def get(self, request):
+        """
+        Returns:
+            200 OK: A streamed CSV or NDJSON attachment.
+            400 Bad Request: If export_format is not supported.
+            403 Forbidden: If the user is not a business user.
+        """
+        if request.user.type != 'business':
+            return Response(
+                {"detail": "Only business users can export their orders."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"export_format": f"Must be one of: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        response = StreamingHttpResponse(
+            iter_export(request.user.id, export_format),
+            content_type=self.content_types[export_format]
+        )
+        response['Content-Disposition'] = f'attachment; filename="orders.{export_format}"'
+        return response
+
 class OrderInProgressCountView(APIView):
     """
     Returns the number of orders with status 'in_progress'
@@ -156,7 +395,7 @@ class OrderInProgressCountView(APIView):
        business_user = get_object_or_404(User, pk=pk, type='business')
        orders = Order.objects.filter(business_user=business_user, status='in_progress')
 
-       return Response({'order_count': len(orders)})
+       return Response({'order_count': orders.count()})
 
 class OrderCompletedCountView(APIView):
     """
@@ -181,5 +420,94 @@ class OrderCompletedCountView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         orders = Order.objects.filter(business_user=pk, status='completed')
+        archived_orders = ArchivedOrder.objects.filter(business_user=pk, status='completed')
+
+        return Response({'completed_order_count': orders.count() + archived_orders.count()})
+
+
+def get_order_status_counts(business_user_ids):
+    """
+    Count the orders per status for each of the given business users
+    with one GROUP BY query on the live and one on the archived orders.
+
+    Returns a dict mapping each business user ID to a dict with one count
+    per status plus the total. Users without orders get zero counts.
+    """
+    statuses = [value for value, _ in Order.STATUS_CHOICES]
+    summary = {
+        business_user_id: {**{status: 0 for status in statuses}, 'total': 0}
+        for business_user_id in business_user_ids
+    }
+
+    for model in (Order, ArchivedOrder):
+        rows = model.objects.filter(
+            business_user_id__in=business_user_ids
+        ).values('business_user_id', 'status').annotate(
+            count=Count('id')
+        ).order_by()
+
+        for row in rows:
+            counts = summary[row['business_user_id']]
+            counts[row['status']] += row['count']
+            counts['total'] += row['count']
+
+    return summary
+
+
+class OrderStatusSummaryView(APIView):
+    """
+    Returns order counts for all statuses of one or many business users.
+
+    - GET /api/order-status-summary/<pk>/:
+      Counts for a single business user.
+
+    - GET /api/order-status-summary/?business_user_ids=1,2,3:
+      Counts for up to 100 business users (comma-separated or repeated
+      parameter), in the requested order.
+
+    Both variants are answered with grouped queries and never load order rows.
+    """
+    permission_classes = [IsAuthenticated]
+    max_business_users = 100
+
+    def get(self, request, pk=None):
+        """
+        Returns:
+            200 OK: {business_user, in_progress, completed, cancelled, total}
+                    for a single user, or a list of these for many users.
+            400 Bad Request: If the IDs are missing, not integers or too many.
+        """
+        if pk is not None:
+            counts = get_order_status_counts([pk])[pk]
+            return Response({'business_user': pk, **counts})
+
+        raw_ids = [
+            value.strip()
+            for param in request.query_params.getlist('business_user_ids')
+            for value in param.split(',')
+            if value.strip()
+        ]
+        try:
+            business_user_ids = list(dict.fromkeys(int(value) for value in raw_ids))
+        except ValueError:
+            return Response(
+                {"business_user_ids": "Must be a comma-separated list of integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not business_user_ids:
+            return Response(
+                {"business_user_ids": "This query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(business_user_ids) > self.max_business_users:
+            return Response(
+                {"business_user_ids": f"At most {self.max_business_users} IDs are allowed."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        return Response({'completed_order_count': len(orders)})
\ No newline at end of file
+        summary = get_order_status_counts(business_user_ids)
+        return Response([
+            {'business_user': business_user_id, **summary[business_user_id]}
+            for business_user_id in business_user_ids
+        ])
\ No newline at end of file
@@ -0,0 +1,201 @@
+import csv
+import heapq
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Max, Min
+
+from orders_app.models import ArchivedOrder, ArchivedOrderFeature, Order, OrderFeature
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_FIELDS = [
+    'id',
+    'customer_user_id',
+    'business_user_id',
+    'title',
+    'revisions',
+    'delivery_time_in_days',
+    'price',
+    'offer_type',
+    'status',
+    'created_at',
+    'updated_at',
+    'features',
+]
+CHUNK_SIZE = 2000
+
+# (order model, legacy feature model, name of the feature's FK to the order)
+SOURCES = (
+    (Order, OrderFeature, 'features_id'),
+    (ArchivedOrder, ArchivedOrderFeature, 'order_id'),
+)
+
+
+def _iter_source(model, feature_model, feature_fk, business_user_id, id_range, chunk_size):
+    queryset = model.objects.filter(business_user_id=business_user_id)
+    if id_range is not None:
+        queryset = queryset.filter(pk__gte=id_range[0], pk__lt=id_range[1])
+
+    rows = queryset.order_by('pk').values(
+        *EXPORT_FIELDS[:-1], 'feature_snapshot__names'
+    ).iterator(chunk_size=chunk_size)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+
+        legacy = {row['id']: [] for row in chunk if row['feature_snapshot__names'] is None}
+        if legacy:
+            features = feature_model.objects.filter(
+                **{f'{feature_fk}__in': list(legacy)}
+            ).order_by('pk').values_list(feature_fk, 'name')
+            for order_id, name in features:
+                legacy[order_id].append(name)
+
+        for row in chunk:
+            names = row.pop('feature_snapshot__names')
+            row['features'] = legacy[row['id']] if names is None else names
+            yield row
+
+
+def iter_orders(business_user_id, id_range=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield the live and archived orders of a business user as dicts, in ID order.
+
+    Both tables are read with iterator(chunk_size=...) and merged lazily;
+    legacy feature rows are fetched with one query per chunk. Memory use
+    is bounded by the chunk size. id_range restricts the export to
+    start <= id < end.
+    """
+    return heapq.merge(
+        *(
+            _iter_source(model, feature_model, feature_fk, business_user_id, id_range, chunk_size)
+            for model, feature_model, feature_fk in SOURCES
+        ),
+        key=lambda row: row['id']
+    )
+
+
+class _Echo:
+    """
+    File-like object whose write() returns the value, for streaming csv.writer output.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows, header=True):
+    """
+    Yield CSV lines for the rows. Timestamps are written in ISO 8601 and
+    features are joined with '; '.
+    """
+    writer = csv.writer(_Echo())
+    if header:
+        yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        row['features'] = '; '.join(row['features'])
+        row['created_at'] = row['created_at'].isoformat()
+        row['updated_at'] = row['updated_at'].isoformat()
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+def iter_ndjson(rows):
+    """
+    Yield one JSON object per line for the rows. Timestamps are written in
+    ISO 8601 with full precision, as in the CSV export.
+    """
+    for row in rows:
+        row['created_at'] = row['created_at'].isoformat()
+        row['updated_at'] = row['updated_at'].isoformat()
+        yield json.dumps(
+            {field: row[field] for field in EXPORT_FIELDS},
+            cls=DjangoJSONEncoder,
+            ensure_ascii=False
+        ) + '\n'
+
+
+def iter_export(business_user_id, export_format, id_range=None, header=True, chunk_size=CHUNK_SIZE):
+    """
+    Yield the export of a business user's orders as text in the given format.
+    """
+    rows = iter_orders(business_user_id, id_range=id_range, chunk_size=chunk_size)
+    if export_format == 'csv':
+        return iter_csv(rows, header=header)
+    return iter_ndjson(rows)
+
+
+def get_id_ranges(business_user_id, parts):
+    """
+    Split the ID span of a business user's orders into `parts` contiguous
+    half-open ranges.
+    """
+    bounds = [
+        model.objects.filter(business_user_id=business_user_id).aggregate(
+            first=Min('pk'), last=Max('pk')
+        )
+        for model, _, _ in SOURCES
+    ]
+    firsts = [bound['first'] for bound in bounds if bound['first'] is not None]
+    if not firsts:
+        return []
+
+    first = min(firsts)
+    last = max(bound['last'] for bound in bounds if bound['last'] is not None) + 1
+    step = max(1, -(-(last - first) // parts))
+    return [(start, min(start + step, last)) for start in range(first, last, step)]
+
+
+def _init_worker():
+    django.setup()
+
+
+def _export_part(business_user_id, export_format, id_range, header, path, chunk_size):
+    with open(path, 'w', newline='', encoding='utf-8') as part:
+        part.writelines(iter_export(business_user_id, export_format, id_range, header, chunk_size))
+    connections.close_all()
+    return path
+
+
+def export_to_file(business_user_id, export_format, path, workers=1, chunk_size=CHUNK_SIZE):
+    """
+    Write the export of a business user's orders to `path`.
+
+    With workers > 1 the ID span is split into one range per worker; every
+    range is exported by its own process into a part file and the parts are
+    concatenated in order.
+    """
+    if workers <= 1:
+        _export_part(business_user_id, export_format, None, True, path, chunk_size)
+        return
+
+    id_ranges = get_id_ranges(business_user_id, workers)
+    part_paths = [f'{path}.part{index}' for index in range(len(id_ranges))]
+
+    # Forked workers must not share the parent's database connections.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(
+                _export_part, business_user_id, export_format, id_range,
+                index == 0, part_path, chunk_size
+            )
+            for index, (id_range, part_path) in enumerate(zip(id_ranges, part_paths))
+        ]
+        for future in futures:
+            future.result()
+
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        if not part_paths and export_format == 'csv':
+            output.writelines(iter_csv([]))
+        for part_path in part_paths:
+            with open(part_path, encoding='utf-8', newline='') as part:
+                shutil.copyfileobj(part, output)
+            os.remove(part_path)
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.models import ArchivedOrder, ArchivedOrderFeature, Order, OrderFeature
+
+ARCHIVED_STATUSES = ('completed', 'cancelled')
+
+
+class Command(BaseCommand):
+    """
+    Moves closed orders into the archive tables.
+
+    Completed and cancelled orders whose last update is older than
+    --older-than-days are copied to ArchivedOrder (with their legacy
+    OrderFeature rows) and deleted from Order. Every batch is one
+    transaction, so the command can be stopped and re-run at any time.
+    """
+    help = "Move old completed and cancelled orders into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=getattr(settings, 'ORDER_ARCHIVE_AFTER_DAYS', 180),
+            help="Archive orders last updated more than this many days ago (default: 180).",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Number of orders moved per transaction (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        archived = 0
+
+        while True:
+            with transaction.atomic():
+                orders = list(
+                    Order.objects
+                    .filter(status__in=ARCHIVED_STATUSES, updated_at__lt=cutoff)
+                    .order_by('pk')[:batch_size]
+                )
+                if not orders:
+                    break
+
+                self.archive_batch(orders)
+
+            archived += len(orders)
+            self.stdout.write(f"Archived {archived} orders...")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} orders."))
+
+    def archive_batch(self, orders):
+        ArchivedOrder.objects.bulk_create([
+            ArchivedOrder(
+                id=order.pk,
+                customer_user_id=order.customer_user_id,
+                business_user_id=order.business_user_id,
+                title=order.title,
+                revisions=order.revisions,
+                delivery_time_in_days=order.delivery_time_in_days,
+                price=order.price,
+                offer_type=order.offer_type,
+                status=order.status,
+                created_at=order.created_at,
+                updated_at=order.updated_at,
+                feature_snapshot_id=order.feature_snapshot_id,
+            )
+            for order in orders
+        ])
+
+        features = OrderFeature.objects.filter(features__in=orders).order_by('pk')
+        ArchivedOrderFeature.objects.bulk_create([
+            ArchivedOrderFeature(order_id=order_id, name=name)
+            for order_id, name in features.values_list('features_id', 'name')
+        ])
+
+        features.delete()
+        Order.objects.filter(pk__in=[order.pk for order in orders]).delete()
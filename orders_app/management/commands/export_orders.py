@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from auth_app.models import User
+from orders_app.export import CHUNK_SIZE, EXPORT_FORMATS, export_to_file, iter_export
+
+
+class Command(BaseCommand):
+    """
+    Exports the order history of a business user as CSV or NDJSON.
+
+    Writes to stdout by default. With --output and --workers N the ID span
+    is split into N ranges that are exported by a process pool in parallel.
+    """
+    help = "Export the live and archived orders of a business user as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('business_user_id', type=int)
+        parser.add_argument(
+            '--export-format',
+            choices=EXPORT_FORMATS,
+            default='csv',
+            help="Output format (default: csv).",
+        )
+        parser.add_argument(
+            '--output',
+            help="File to write to (default: stdout).",
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="Number of processes exporting ID ranges in parallel; requires --output (default: 1).",
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"Rows fetched per database round-trip (default: {CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        business_user_id = options['business_user_id']
+        if not User.objects.filter(pk=business_user_id, type='business').exists():
+            raise CommandError(f"Business user {business_user_id} does not exist.")
+        if options['workers'] > 1 and not options['output']:
+            raise CommandError("--workers requires --output.")
+
+        if not options['output']:
+            for line in iter_export(
+                business_user_id, options['export_format'], chunk_size=options['chunk_size']
+            ):
+                self.stdout.write(line, ending='')
+            return
+
+        export_to_file(
+            business_user_id,
+            options['export_format'],
+            options['output'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stderr.write(self.style.SUCCESS(f"Exported orders to {options['output']}."))
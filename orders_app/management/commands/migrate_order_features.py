@@ -0,0 +1,87 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from orders_app.models import FeatureSnapshot, Order, OrderFeature
+
+
+class Command(BaseCommand):
+    """
+    Moves the feature names of existing orders from OrderFeature rows into
+    shared FeatureSnapshot rows.
+
+    Orders are processed in batches, each in its own transaction: the
+    batch's features are read in one query, missing snapshots are created
+    with one bulk insert, the orders are pointed at their snapshot with one
+    bulk update and the old OrderFeature rows are deleted. The command can
+    be interrupted and re-run at any time.
+    """
+    help = "Migrate OrderFeature rows to deduplicated feature snapshots."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of orders migrated per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        migrated = 0
+        last_id = 0
+
+        while True:
+            with transaction.atomic():
+                orders = list(
+                    Order.objects
+                    .filter(feature_snapshot__isnull=True, pk__gt=last_id)
+                    .order_by('pk')
+                    .only('pk')[:batch_size]
+                )
+                if not orders:
+                    break
+
+                self.migrate_batch(orders)
+
+            last_id = orders[-1].pk
+            migrated += len(orders)
+            self.stdout.write(f"Migrated {migrated} orders...")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Migrated {migrated} orders; {FeatureSnapshot.objects.count()} feature snapshots in total."
+        ))
+
+    def migrate_batch(self, orders):
+        names = defaultdict(list)
+        features = OrderFeature.objects.filter(
+            features__in=orders
+        ).order_by('pk').values_list('features_id', 'name')
+        for order_id, name in features:
+            names[order_id].append(name)
+
+        names_by_digest = {}
+        for order in orders:
+            order_names = names[order.pk]
+            order.digest = FeatureSnapshot.compute_digest(order_names)
+            names_by_digest[order.digest] = order_names
+
+        FeatureSnapshot.objects.bulk_create(
+            [
+                FeatureSnapshot(digest=digest, names=order_names)
+                for digest, order_names in names_by_digest.items()
+            ],
+            ignore_conflicts=True,
+        )
+        snapshot_ids = dict(
+            FeatureSnapshot.objects.filter(
+                digest__in=names_by_digest
+            ).values_list('digest', 'pk')
+        )
+
+        for order in orders:
+            order.feature_snapshot_id = snapshot_ids[order.digest]
+        Order.objects.bulk_update(orders, ['feature_snapshot'], batch_size=500)
+
+        OrderFeature.objects.filter(features__in=orders).delete()
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from orders_app.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    """
+    Deletes expired idempotency keys.
+
+    Rows are deleted in batches of primary keys, so a large backlog does
+    not hold one long write lock. Meant to run periodically (e.g. cron).
+    """
+    help = "Delete idempotency keys whose expires_at lies in the past."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Number of keys deleted per statement (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+        deleted = 0
+
+        while True:
+            ids = list(
+                IdempotencyKey.objects
+                .filter(expires_at__lte=now)
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            count, _ = IdempotencyKey.objects.filter(pk__in=ids).delete()
+            deleted += count
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired idempotency keys."))
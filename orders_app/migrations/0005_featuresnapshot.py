@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0004_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeatureSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('names', models.JSONField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='feature_snapshot',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='orders', to='orders_app.featuresnapshot'),
+        ),
+    ]
@@ -1,3 +1,7 @@
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 class Order(models.Model):
     """
@@ -5,7 +9,9 @@ class Order(models.Model):
 
     An order is created by a customer user based on an OfferDetail
     and is fulfilled by a business user. It stores a snapshot of
-    the offer data at the time of ordering.
+    the offer data at the time of ordering. The feature names are
+    referenced through a shared FeatureSnapshot; orders created before
+    snapshots existed keep theirs in OrderFeature rows.
     """
 
     STATUS_CHOICES = [
@@ -29,9 +35,23 @@ class Order(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     offer_type = models.CharField(max_length=50)
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='in_progress')
+    feature_snapshot = models.ForeignKey(
+        'FeatureSnapshot',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='orders'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'], name='order_business_status_idx'),
+            models.Index(fields=['customer_user', '-created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', '-created_at'], name='order_business_created_idx'),
+        ]
+
 class OrderFeature(models.Model):
     """
     Represents a single feature included in an order.
@@ -44,4 +64,134 @@ class OrderFeature(models.Model):
         on_delete=models.CASCADE,
         related_name='order_features'
     )
-    name = models.CharField(max_length=255)
\ No newline at end of file
+    name = models.CharField(max_length=255)
+
+class FeatureSnapshot(models.Model):
+    """
+    An immutable, content-addressed list of feature names.
+
+    Orders placed from the same offer tier share one snapshot instead of
+    copying every feature name into their own rows.
+
+    Fields:
+    - digest: SHA-256 of the JSON-encoded name list (unique).
+    - names: The feature names in their original order.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    names = models.JSONField()
+
+    @staticmethod
+    def compute_digest(names):
+        return hashlib.sha256(
+            json.dumps(list(names), ensure_ascii=False, separators=(',', ':')).encode()
+        ).hexdigest()
+
+    @classmethod
+    def for_names(cls, names):
+        """
+        Return the snapshot for the given names, creating it if needed.
+        """
+        names = list(names)
+        snapshot, _ = cls.objects.get_or_create(
+            digest=cls.compute_digest(names),
+            defaults={'names': names}
+        )
+        return snapshot
+
+    def __str__(self):
+        return ', '.join(self.names)
+
+class ArchivedOrder(models.Model):
+    """
+    A completed or cancelled order moved out of the Order table by
+    `manage.py archive_orders`.
+
+    Keeps the original order ID and timestamps, so archived orders are
+    serialized exactly like live ones. Only read when clients ask for
+    the order history.
+
+    Fields:
+    - Same as Order, with created_at/updated_at copied unchanged.
+    - archived_at: When the order was moved to the archive.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    customer_user = models.ForeignKey(
+        'auth_app.User',
+        on_delete=models.CASCADE,
+        related_name='archived_customer_orders'
+    )
+    business_user = models.ForeignKey(
+        'auth_app.User',
+        on_delete=models.CASCADE,
+        related_name='archived_business_orders'
+    )
+    title = models.CharField(max_length=100)
+    revisions = models.PositiveIntegerField()
+    delivery_time_in_days = models.PositiveIntegerField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    offer_type = models.CharField(max_length=50)
+    status = models.CharField(max_length=50, choices=Order.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    feature_snapshot = models.ForeignKey(
+        FeatureSnapshot,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='archived_orders'
+    )
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'], name='archived_business_status_idx'),
+            models.Index(fields=['customer_user', '-created_at'], name='archived_customer_created_idx'),
+            models.Index(fields=['business_user', '-created_at'], name='archived_business_created_idx'),
+        ]
+
+class ArchivedOrderFeature(models.Model):
+    """
+    A legacy OrderFeature row of an archived order.
+    """
+    order = models.ForeignKey(
+        ArchivedOrder,
+        on_delete=models.CASCADE,
+        related_name='order_features'
+    )
+    name = models.CharField(max_length=255)
+
+class IdempotencyKey(models.Model):
+    """
+    Remembers the response to a request sent with an Idempotency-Key header.
+
+    A retry with the same key (per user) gets the stored response instead
+    of being executed again. The unique constraint on (user, key) makes
+    concurrent duplicates collapse into a single execution.
+
+    Fields:
+    - user: The user who sent the request.
+    - key: The client-provided Idempotency-Key header value.
+    - request_hash: SHA-256 of the request body, to detect key reuse with other data.
+    - response_status / response_body: The stored response.
+    - created_at: When the key was first used.
+    - expires_at: After this point the key may be used for a new request.
+    """
+    user = models.ForeignKey(
+        'auth_app.User',
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys'
+    )
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField(null=True)
+    response_body = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='unique_idempotency_key_per_user'),
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='idempotency_expires_idx'),
+        ]
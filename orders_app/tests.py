@@ -1,3 +1,264 @@
-from django.test import TestCase
+import json
+import sqlite3
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.db import IntegrityError, OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from auth_app.models import User
+from core.pagination import CappedListPagination
+from offers_app.tests import create_offer
+from orders_app.export import iter_export
+from orders_app.models import IdempotencyKey, Order, OrderFeature
+
+
+class OrderListQueryTests(APITestCase):
+    """
+    The orders list reads user IDs from the order row itself and must
+    not query the user table.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        detail = create_offer(self.business_user).details.first()
+
+        self.client.force_authenticate(self.customer_user)
+        for _ in range(3):
+            response = self.client.post(
+                '/api/orders/', {'offer_detail_id': detail.id}, format='json'
+            )
+            self.assertEqual(response.status_code, 201)
+
+    def test_list_does_not_query_users(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/orders/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0]['customer_user'], self.customer_user.id)
+        self.assertEqual(response.data[0]['business_user'], self.business_user.id)
+        self.assertFalse(
+            [query['sql'] for query in context.captured_queries if 'auth_app_user' in query['sql']]
+        )
+
+
+
+class OrderListTests(APITestCase):
+    """
+    Filters, the default cap, cursor pages and query count of the orders list.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        self.detail = create_offer(self.business_user).details.first()
+        self.client.force_authenticate(self.customer_user)
+        self.create_orders(5)
+
+    def create_orders(self, count):
+        for _ in range(count):
+            response = self.client.post(
+                '/api/orders/', {'offer_detail_id': self.detail.id}, format='json'
+            )
+            self.assertEqual(response.status_code, 201)
+
+    def ids(self, response):
+        return [order['id'] for order in response.data]
+
+    def test_status_filter(self):
+        completed = list(Order.objects.order_by('pk').values_list('pk', flat=True)[:2])
+        Order.objects.filter(pk__in=completed).update(status='completed')
+
+        response = self.client.get('/api/orders/', {'status': 'completed'})
+
+        self.assertEqual(sorted(self.ids(response)), completed)
+        self.assertEqual(self.client.get('/api/orders/', {'status': 'open'}).status_code, 400)
+
+    def test_created_at_filters(self):
+        orders = list(Order.objects.order_by('pk'))
+        for day, order in zip((1, 2, 3, 4, 5), orders):
+            Order.objects.filter(pk=order.pk).update(
+                created_at=timezone.make_aware(timezone.datetime(2024, 1, day, 12))
+            )
+
+        response = self.client.get(
+            '/api/orders/', {'created_after': '2024-01-02', 'created_before': '2024-01-04'}
+        )
+
+        self.assertEqual(self.ids(response), [orders[3].id, orders[2].id, orders[1].id])
+        response = self.client.get('/api/orders/', {'created_after': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_default_list_is_capped(self):
+        with mock.patch.object(CappedListPagination, 'max_results', 3):
+            capped = self.client.get('/api/orders/')
+            complete = self.client.get('/api/orders/', {'status': 'in_progress', 'role': 'business'})
+
+        self.assertEqual(len(capped.data), 3)
+        self.assertEqual(capped['X-Truncated'], 'true')
+        self.assertEqual(complete.status_code, 404)
+        self.assertEqual(len(self.client.get('/api/orders/').data), 5)
+        self.assertFalse(self.client.get('/api/orders/').has_header('X-Truncated'))
+
+    def test_cursor_walk_across_equal_timestamps(self):
+        Order.objects.update(created_at=timezone.now())
+        expected = list(Order.objects.order_by('-pk').values_list('pk', flat=True))
+
+        response = self.client.get('/api/orders/', {'pagination': 'cursor', 'page_size': 2})
+        pages = [[order['id'] for order in response.data['results']]]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            pages.append([order['id'] for order in response.data['results']])
+        previous = self.client.get(response.data['previous'])
+
+        self.assertEqual([order_id for page in pages for order_id in page], expected)
+        self.assertEqual([order['id'] for order in previous.data['results']], pages[-2])
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/orders/')
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_grow_with_orders(self):
+        legacy = Order.objects.order_by('pk').first()
+        Order.objects.filter(pk=legacy.pk).update(feature_snapshot=None)
+        OrderFeature.objects.create(features=legacy, name="Legacy feature")
+        queries = self.count_list_queries()
+
+        self.create_orders(5)
+
+        self.assertEqual(self.count_list_queries(), queries)
+        response = self.client.get('/api/orders/')
+        self.assertEqual(
+            next(order for order in response.data if order['id'] == legacy.id)['features'],
+            ["Legacy feature"]
+        )
+
+
+class OrderIdempotencyTests(APITestCase):
+    """
+    A repeated Idempotency-Key replays the stored response instead of
+    creating another order.
+    """
+
+    def setUp(self):
+        business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        self.details = list(create_offer(business_user).details.all())
+        self.client.force_authenticate(self.customer_user)
+
+    def post(self, detail, key='key-1'):
+        return self.client.post(
+            '/api/orders/', {'offer_detail_id': detail.id}, format='json',
+            HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_repeated_key_replays_response(self):
+        first = self.post(self.details[0])
+        second = self.post(self.details[0])
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_key_reused_with_other_body_is_rejected(self):
+        self.post(self.details[0])
+
+        response = self.post(self.details[1])
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_expired_key_creates_new_order(self):
+        first = self.post(self.details[0])
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        second = self.post(self.details[0])
+
+        self.assertEqual(second.status_code, 201)
+        self.assertNotEqual(second.data['id'], first.data['id'])
+        self.assertFalse(second.has_header('Idempotent-Replayed'))
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_locked_database_returns_503_and_keeps_key_free(self):
+        with mock.patch(
+            'orders_app.api.views.OrdersView.create_order',
+            side_effect=OperationalError('database is locked')
+        ):
+            response = self.post(self.details[0])
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(IdempotencyKey.objects.exists())
+        self.assertEqual(self.post(self.details[0]).status_code, 201)
+
+    def test_locked_database_detected_by_sqlite_error_code(self):
+        error = OperationalError('locked')
+        error.__cause__ = sqlite3.OperationalError('locked')
+        error.__cause__.sqlite_errorcode = sqlite3.SQLITE_BUSY
+
+        with mock.patch('orders_app.api.views.OrdersView.create_order', side_effect=error):
+            response = self.post(self.details[0])
+
+        self.assertEqual(response.status_code, 503)
+
+    def test_other_operational_errors_are_raised(self):
+        with mock.patch(
+            'orders_app.api.views.OrdersView.create_order',
+            side_effect=OperationalError('no such table: orders_app_order')
+        ):
+            with self.assertRaises(OperationalError):
+                self.post(self.details[0])
+
+    def test_integrity_error_of_handler_is_raised(self):
+        with mock.patch(
+            'orders_app.api.views.OrdersView.create_order',
+            side_effect=IntegrityError('NOT NULL constraint failed: orders_app_order.title')
+        ):
+            with self.assertRaises(IntegrityError):
+                self.post(self.details[0])
+
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+
+class OrderExportTests(APITestCase):
+    """
+    Both export formats write the same full-precision timestamps.
+    """
+
+    def test_ndjson_keeps_microseconds(self):
+        business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        customer_user = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        detail = create_offer(business_user).details.first()
+        self.client.force_authenticate(customer_user)
+        self.client.post('/api/orders/', {'offer_detail_id': detail.id}, format='json')
+        created_at = timezone.now().replace(microsecond=123456)
+        Order.objects.update(created_at=created_at)
+
+        line = json.loads(next(iter_export(business_user.id, 'ndjson')))
+        csv_row = list(iter_export(business_user.id, 'csv'))[1]
+
+        self.assertEqual(line['created_at'], created_at.isoformat())
+        self.assertIn(line['created_at'], csv_row)
@@ -1,3 +1,7 @@
 from django.contrib import admin
+from .models import PlatformCounters
 
-# Register your models here.
+class PlatformCountersExtension(admin.ModelAdmin):
+    list_display = ("id", "review_count", "rating_sum", "business_count", "offer_count")
+
+admin.site.register(PlatformCounters, PlatformCountersExtension)
@@ -1,6 +1,7 @@
 from django.urls import path
-from platform_app.api.views import BaseInfoView
+from platform_app.api.views import BaseInfoView, BusinessDashboardView
 
 urlpatterns = [
     path('base-info/', BaseInfoView.as_view(), name='base-info-detail'),
+    path('business/<int:pk>/dashboard/', BusinessDashboardView.as_view(), name='business-dashboard-detail'),
 ]
\ No newline at end of file
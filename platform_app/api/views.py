@@ -1,11 +1,12 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import status
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Avg
 
-from reviews_app.models import Review
-from offers_app.models import Offer
 from auth_app.models import User
+from platform_app.dashboard import get_dashboard
+from platform_app.models import PlatformCounters
 
 
 class BaseInfoView(APIView):
@@ -13,6 +14,8 @@ class BaseInfoView(APIView):
     Provides aggregated statistics about the platform for public access.
     
     This endpoint is publicly accessible and does not require authentication.
+    The values are read from the incrementally maintained PlatformCounters
+    row with a single primary key lookup.
 
     Returns:
         JSON response containing:
@@ -27,9 +30,44 @@ class BaseInfoView(APIView):
         """
         Handle GET requests to retrieve the platform's base information.
         """
+        counters = PlatformCounters.get()
+
         return Response({
-            "review_count": Review.objects.count(),
-            "average_rating": round(Review.objects.aggregate(avg=Avg('rating'))['avg'] or 0,1),
-            "business_profile_count": User.objects.filter(type='business').count(),
-            "offer_count": Offer.objects.count(),
+            "review_count": counters.review_count,
+            "average_rating": counters.average_rating,
+            "business_profile_count": counters.business_count,
+            "offer_count": counters.offer_count,
         })
+
+
+class BusinessDashboardView(APIView):
+    """
+    Returns all dashboard figures of a business user in one call.
+
+    The figures are computed with a few grouped queries and cached until
+    an order, review or offer of the business user changes. Only the
+    business user itself (or staff) may read them, as they include revenue.
+
+    Returns:
+        JSON response containing:
+        - orders: Order count per status and in total (including archived orders).
+        - revenue: Sum of Order.price for completed and in-progress orders and both together.
+        - review_count / average_rating: Reviews received, average rounded to one decimal place.
+        - offer_count / min_offer_price: Offers created and the cheapest offer price.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        """
+        Returns:
+            200 OK: The dashboard figures.
+            403 Forbidden: If the user is neither the business user nor staff.
+            404 Not Found: If the business user does not exist.
+        """
+        if pk != request.user.id and not request.user.is_staff:
+            return Response(
+                {"detail": "You do not have permission to view this dashboard."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        get_object_or_404(User, pk=pk, type='business')
+        return Response(get_dashboard(pk))
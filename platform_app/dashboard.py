@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Min, Sum
+
+from offers_app.models import Offer
+from orders_app.models import ArchivedOrder, Order
+from reviews_app.models import BusinessReviewStats
+
+CACHE_TIMEOUT = getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 300)
+
+
+def dashboard_key(business_user_id):
+    return f'dashboard:{business_user_id}'
+
+
+def compute_dashboard(business_user_id):
+    """
+    Compute the dashboard figures of a business user with three aggregate
+    queries (orders per status, live and archived, and offers) and a
+    primary key lookup of the business's review stats.
+    """
+    statuses = [value for value, _ in Order.STATUS_CHOICES]
+    order_counts = {status: 0 for status in statuses}
+    revenue = {status: 0 for status in statuses}
+
+    for model in (Order, ArchivedOrder):
+        rows = model.objects.filter(
+            business_user_id=business_user_id
+        ).values('status').annotate(
+            count=Count('id'),
+            revenue=Sum('price')
+        ).order_by()
+
+        for row in rows:
+            order_counts[row['status']] += row['count']
+            revenue[row['status']] += row['revenue'] or 0
+
+    reviews = BusinessReviewStats.get(business_user_id)
+    offers = Offer.objects.filter(owner_id=business_user_id).aggregate(
+        count=Count('id'),
+        cheapest=Min('min_price')
+    )
+
+    return {
+        'business_user': business_user_id,
+        'orders': {**order_counts, 'total': sum(order_counts.values())},
+        'revenue': {
+            'completed': float(revenue['completed']),
+            'in_progress': float(revenue['in_progress']),
+            'total': float(revenue['completed'] + revenue['in_progress']),
+        },
+        'review_count': reviews.review_count,
+        'average_rating': reviews.average_rating,
+        'offer_count': offers['count'],
+        'min_offer_price': int(offers['cheapest']) if offers['cheapest'] is not None else None,
+    }
+
+
+def get_dashboard(business_user_id):
+    """
+    Return the cached dashboard of a business user, computing it on a miss.
+    """
+    key = dashboard_key(business_user_id)
+    data = cache.get(key)
+    if data is None:
+        data = compute_dashboard(business_user_id)
+        cache.set(key, data, CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_dashboard(*business_user_ids):
+    """
+    Drop the cached dashboards of the given business users once the
+    surrounding transaction has committed.
+
+    Called from signal receivers and, for bulk writes that send no
+    signals, directly by the code performing them.
+    """
+    keys = [dashboard_key(business_user_id) for business_user_id in business_user_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
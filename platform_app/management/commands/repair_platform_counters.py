@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from platform_app.models import PlatformCounters
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the platform counters from the review, offer and user tables.
+
+    Use it after writes that bypassed the model signals (e.g. raw SQL or
+    queryset.update()) left the counters out of sync.
+    """
+    help = "Recompute the platform counters used by /api/base-info/."
+
+    def handle(self, *args, **options):
+        counters = PlatformCounters.recompute()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"reviews: {counters.review_count}, rating sum: {counters.rating_sum}, "
+            f"business users: {counters.business_count}, offers: {counters.offer_count}"
+        ))
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:10
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def compute_counters(apps, schema_editor):
+    PlatformCounters = apps.get_model('platform_app', 'PlatformCounters')
+    Review = apps.get_model('reviews_app', 'Review')
+    Offer = apps.get_model('offers_app', 'Offer')
+    User = apps.get_model('auth_app', 'User')
+
+    reviews = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+    PlatformCounters.objects.update_or_create(
+        pk=1,
+        defaults={
+            'review_count': reviews['count'],
+            'rating_sum': reviews['total'] or 0,
+            'business_count': User.objects.filter(type='business').count(),
+            'offer_count': Offer.objects.count(),
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth_app', '0002_user_user_type_idx'),
+        ('offers_app', '0006_offer_offer_owner_updated_idx'),
+        ('reviews_app', '0002_review_review_business_updated_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformCounters',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.BigIntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('business_count', models.BigIntegerField(default=0)),
+                ('offer_count', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(compute_counters, migrations.RunPython.noop),
+    ]
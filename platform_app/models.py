@@ -1,3 +1,77 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Sum
 
-# Create your models here.
+
+class PlatformCounters(models.Model):
+    """
+    Single-row table holding the platform statistics shown by /api/base-info/.
+
+    The counters are adjusted incrementally in the same transaction as the
+    review, offer and user writes that change them, so reading them is a
+    single primary key lookup. `recompute()` rebuilds them from scratch.
+
+    Fields:
+    - review_count: Total number of reviews.
+    - rating_sum: Sum of all review ratings.
+    - business_count: Total number of business users.
+    - offer_count: Total number of offers.
+    """
+    SINGLETON_ID = 1
+
+    review_count = models.BigIntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    business_count = models.BigIntegerField(default=0)
+    offer_count = models.BigIntegerField(default=0)
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @classmethod
+    def get(cls):
+        """
+        Return the counters, computing them first if the row does not exist yet.
+        """
+        counters = cls.objects.filter(pk=cls.SINGLETON_ID).first()
+        if counters is None:
+            counters = cls.recompute()
+        return counters
+
+    @classmethod
+    def adjust(cls, **deltas):
+        """
+        Atomically add the given deltas to the counters with a single UPDATE.
+
+        Example: PlatformCounters.adjust(review_count=1, rating_sum=5)
+        """
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if not changes:
+            return
+
+        if not cls.objects.filter(pk=cls.SINGLETON_ID).update(**changes):
+            cls.recompute()
+
+    @classmethod
+    @transaction.atomic
+    def recompute(cls):
+        """
+        Recompute all counters from the source tables.
+        """
+        from auth_app.models import User
+        from offers_app.models import Offer
+        from reviews_app.models import Review
+
+        reviews = Review.objects.aggregate(count=models.Count('id'), total=Sum('rating'))
+
+        counters, _ = cls.objects.update_or_create(
+            pk=cls.SINGLETON_ID,
+            defaults={
+                'review_count': reviews['count'],
+                'rating_sum': reviews['total'] or 0,
+                'business_count': User.objects.filter(type='business').count(),
+                'offer_count': Offer.objects.count(),
+            }
+        )
+        return counters
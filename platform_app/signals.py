@@ -0,0 +1,63 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from auth_app.models import User
+from offers_app.models import Offer
+from orders_app.models import Order
+from platform_app.dashboard import invalidate_dashboard
+from platform_app.models import PlatformCounters
+from reviews_app.models import Review
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender, instance, created, **kwargs):
+    """
+    Count new reviews and apply rating changes of edited reviews.
+    """
+    if created:
+        PlatformCounters.adjust(review_count=1, rating_sum=instance.rating)
+    elif getattr(instance, 'previous_rating', None) is not None:
+        PlatformCounters.adjust(rating_sum=instance.rating - instance.previous_rating)
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender, instance, **kwargs):
+    PlatformCounters.adjust(review_count=-1, rating_sum=-instance.rating)
+
+
+@receiver(post_save, sender=Offer)
+def count_created_offer(sender, instance, created, **kwargs):
+    if created:
+        PlatformCounters.adjust(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_deleted_offer(sender, instance, **kwargs):
+    PlatformCounters.adjust(offer_count=-1)
+
+
+@receiver(post_save, sender=User)
+def count_created_business_user(sender, instance, created, **kwargs):
+    if created and instance.type == 'business':
+        PlatformCounters.adjust(business_count=1)
+
+
+@receiver(post_delete, sender=User)
+def count_deleted_business_user(sender, instance, **kwargs):
+    if instance.type == 'business':
+        PlatformCounters.adjust(business_count=-1)
+
+
+@receiver([post_save, post_delete], sender=Order)
+def invalidate_dashboard_on_order_write(sender, instance, **kwargs):
+    invalidate_dashboard(instance.business_user_id)
+
+
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_dashboard_on_review_write(sender, instance, **kwargs):
+    invalidate_dashboard(instance.business_user_id)
+
+
+@receiver([post_save, post_delete], sender=Offer)
+def invalidate_dashboard_on_offer_write(sender, instance, **kwargs):
+    invalidate_dashboard(instance.owner_id)
@@ -1,3 +1,121 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from auth_app.models import User
+from offers_app.models import Offer
+from offers_app.tests import create_offer
+from platform_app.models import PlatformCounters
+from reviews_app.models import Review
+
+
+class BusinessDashboardPermissionTests(APITestCase):
+    """
+    The dashboard contains revenue figures and is private to the business user.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.customer_user = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        self.url = f'/api/business/{self.business_user.id}/dashboard/'
+
+    def test_customer_cannot_read_business_dashboard(self):
+        self.client.force_authenticate(self.customer_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertNotIn('revenue', response.data)
+
+    def test_business_user_reads_own_dashboard(self):
+        self.client.force_authenticate(self.business_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('revenue', response.data)
+
+
+class BusinessDashboardInvalidationTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.offer = create_offer(self.business_user, prices=(100, 200, 300))
+        self.url = f'/api/business/{self.business_user.id}/dashboard/'
+        self.client.force_authenticate(self.business_user)
+
+    def test_detail_delete_refreshes_min_offer_price(self):
+        self.assertEqual(self.client.get(self.url).data['min_offer_price'], 100)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.details.get(price=100).delete()
+
+        self.assertEqual(self.client.get(self.url).data['min_offer_price'], 200)
+
+
+class PlatformCountersTests(APITestCase):
+    """
+    The incrementally maintained counters must match a full recount after
+    any mix of creates, rating changes and deletes.
+    """
+
+    def assert_counters_match_tables(self):
+        reviews = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+        counters = PlatformCounters.objects.get(pk=PlatformCounters.SINGLETON_ID)
+
+        self.assertEqual(counters.review_count, reviews['count'])
+        self.assertEqual(counters.rating_sum, reviews['total'] or 0)
+        self.assertEqual(counters.business_count, User.objects.filter(type='business').count())
+        self.assertEqual(counters.offer_count, Offer.objects.count())
+
+    def test_mixed_writes(self):
+        businesses = [
+            User.objects.create_user(username=f"business{index}", password="password", type="business")
+            for index in range(3)
+        ]
+        customer = User.objects.create_user(username="customer", password="password", type="customer")
+        offers = [create_offer(business) for business in businesses for _ in range(2)]
+        reviews = [
+            Review.objects.create(
+                business_user=business, reviewer=customer, rating=rating, description="Review"
+            )
+            for business, rating in zip(businesses * 2, (5, 4, 3, 2, 1, 5))
+        ]
+        self.assert_counters_match_tables()
+
+        reviews[0].rating = 1
+        reviews[0].save()
+        reviews[1].description = "Edited"
+        reviews[1].save(update_fields=['description'])
+        self.client.force_authenticate(customer)
+        response = self.client.patch(f'/api/reviews/{reviews[2].id}/', {'rating': 5}, format='json')
+        self.assertEqual(response.status_code, 200)
+        reviews[3].delete()
+        offers[0].delete()
+        self.assert_counters_match_tables()
+
+        # Deleting a business user cascades to their offers and reviews.
+        businesses[1].delete()
+        customer.delete()
+        self.assert_counters_match_tables()
+
+    def test_missing_row_is_recomputed(self):
+        business = User.objects.create_user(username="business", password="password", type="business")
+        create_offer(business)
+        PlatformCounters.objects.all().delete()
+
+        customer = User.objects.create_user(username="customer", password="password", type="customer")
+        Review.objects.create(business_user=business, reviewer=customer, rating=4, description="Review")
+
+        self.assert_counters_match_tables()
+        response = self.client.get('/api/base-info/')
+        self.assertEqual(response.data['review_count'], 1)
+        self.assertEqual(response.data['average_rating'], 4)
@@ -6,6 +6,7 @@ from django.shortcuts import get_object_or_404
 
 from profile_app.models import Profile
 from auth_app.models import User
+from core.streaming import StreamingListMixin
 from .serializers import ProfileSerializer, ProfileUpdateSerializer, CustomerProfileListSerializer, BusinessProfileListSerializer
 
 
@@ -64,9 +65,10 @@ class DetailProfileView(APIView):
         response_serializer = ProfileSerializer(profile)
         return Response(response_serializer.data)
 
-class ListProfileView(APIView):
+class ListProfileView(StreamingListMixin, APIView):
     """
     Retrieves a list of profiles filtered by type (business or customer).
+    `?stream=true` streams the list as a JSON array with bounded memory.
 
     Permissions:
         - The user must be authenticated.
@@ -94,7 +96,12 @@ class ListProfileView(APIView):
             user__type=type
         )
         if type == 'business':
-            serializer = BusinessProfileListSerializer(profiles, many=True)
+            serializer_class = BusinessProfileListSerializer
         else:
-            serializer = CustomerProfileListSerializer(profiles, many=True)
+            serializer_class = CustomerProfileListSerializer
+
+        if self.wants_stream(request):
+            return self.stream_response(profiles, serializer_class)
+
+        serializer = serializer_class(profiles, many=True)
         return Response(serializer.data)
\ No newline at end of file
@@ -1,7 +1,12 @@
 from django.contrib import admin
-from .models import Review
+from .models import BusinessReviewStats, Review
 
 class ReviewExtension(admin.ModelAdmin):
     list_display = ("id", "business_user", "reviewer", "rating", "description", "created_at", "updated_at")
     
-admin.site.register(Review, ReviewExtension)
\ No newline at end of file
+admin.site.register(Review, ReviewExtension)
+
+class BusinessReviewStatsExtension(admin.ModelAdmin):
+    list_display = ("business_user", "review_count", "rating_sum", "rating_1", "rating_2", "rating_3", "rating_4", "rating_5")
+
+admin.site.register(BusinessReviewStats, BusinessReviewStatsExtension)
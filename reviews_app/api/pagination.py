@@ -0,0 +1,17 @@
+from core.pagination import KeysetPagination
+
+
+class ReviewCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for the reviews list.
+
+    Supports ordering by updated_at and rating with the review ID as
+    tie-breaker. Combined with the business_user_id / reviewer_id filters,
+    every page is read from a composite index, so its cost does not depend
+    on how many reviews a business has received.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_fields = ('updated_at', 'rating')
+    default_ordering = '-updated_at'
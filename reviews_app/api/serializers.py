@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from django.db import transaction
 from reviews_app.models import Review
 from auth_app.models import User
+from core.fields import ForeignKeyIdField
 
 
 class ReviewCreateSerializer(serializers.ModelSerializer):
@@ -17,10 +19,7 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
     business_user = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.filter(type='business')
     )
-    reviewer = serializers.IntegerField(
-        source='reviewer.id',
-        read_only=True
-    )
+    reviewer = ForeignKeyIdField()
     rating = serializers.IntegerField()
     description = serializers.CharField()
 
@@ -42,6 +41,7 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         """
         Creates a new Review instance, automatically setting the reviewer
@@ -69,10 +69,7 @@ class ReviewsListSerializer(serializers.ModelSerializer):
     - description: Review text.
     - created_at, updated_at: Timestamps (read-only).
     """
-    reviewer = serializers.IntegerField(
-        source='reviewer.id',
-        read_only=True
-    )
+    reviewer = ForeignKeyIdField()
     rating = serializers.IntegerField()
     description = serializers.CharField()
 
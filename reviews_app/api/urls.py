@@ -1,7 +1,8 @@
 from django.urls import path
-from reviews_app.api.views import ReviewView, ReviewDetailView
+from reviews_app.api.views import ReviewView, ReviewDetailView, BusinessRatingStatsView
 
 urlpatterns = [
     path('reviews/', ReviewView.as_view(), name='review-list-create'),
     path('reviews/<int:pk>/', ReviewDetailView.as_view(), name='review-detail'),
+    path('business/<int:pk>/rating-stats/', BusinessRatingStatsView.as_view(), name='business-rating-stats-detail'),
 ]
\ No newline at end of file
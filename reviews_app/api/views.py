@@ -4,18 +4,40 @@ from rest_framework.response import Response
 from rest_framework import filters, status
 from .serializers import ReviewCreateSerializer, ReviewsListSerializer, ReviewDetailsWithPrimaryKeySerializer
 from reviews_app.models import Review
+from reviews_app.rating_stats import get_rating_stats
+from reviews_app.search import review_search_index
+from auth_app.models import User
 from rest_framework.generics import ListCreateAPIView
 from django.shortcuts import get_object_or_404
+from django.db import transaction
+from core.pagination import CappedListPagination, OptionalKeysetPaginationMixin
+from core.search import FullTextSearchFilter
+from core.streaming import StreamingListMixin
+from .pagination import ReviewCursorPagination
 
-class ReviewView(ListCreateAPIView):
+class ReviewView(StreamingListMixin, OptionalKeysetPaginationMixin, ListCreateAPIView):
     """
     View for listing all reviews and creating a new review.
+
+    `?search=` restricts the list to reviews whose description matches
+    all given words (prefix matching on a full-text index), ordered by
+    relevance unless an ordering is given; it combines with the
+    business_user_id and reviewer_id filters.
+    `?pagination=cursor` switches to keyset pagination (ordering by
+    updated_at or rating); without it, the first 100 matching reviews are
+    returned as a plain list (with an `X-Truncated: true` header when there
+    are more). `?stream=true` streams the full list as a JSON array with
+    bounded memory.
     """
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewsListSerializer
-    filter_backends = [filters.OrderingFilter]
+    pagination_class = CappedListPagination
+    keyset_pagination_class = ReviewCursorPagination
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
     ordering_fields = ['updated_at', 'rating']
     ordering = ['-updated_at'] 
+    search_fields = ['description']
+    search_index = review_search_index
 
     def get_queryset(self):
         """
@@ -34,6 +56,18 @@ class ReviewView(ListCreateAPIView):
             queryset = queryset.filter(reviewer=int(reviewer_id))
 
         return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the reviews, streamed when requested with `?stream=true`.
+        """
+        if self.wants_stream(request):
+            return self.stream_response(
+                self.filter_queryset(self.get_queryset()),
+                self.get_serializer_class(),
+                context=self.get_serializer_context()
+            )
+        return super().list(request, *args, **kwargs)
     
 
     def post(self, request):
@@ -68,7 +102,7 @@ class ReviewDetailView(APIView):
         Returns 204 No Content on successful deletion.
         """
         review = get_object_or_404(Review, pk=pk)
-        if review.reviewer != request.user:
+        if review.reviewer_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to delete this offer."},
                 status=status.HTTP_403_FORBIDDEN
@@ -84,7 +118,7 @@ class ReviewDetailView(APIView):
         Accepts partial fields validated by ReviewDetailsWithPrimaryKeySerializer.
         """
         review = get_object_or_404(Review, pk=pk)
-        if review.reviewer != request.user:
+        if review.reviewer_id != request.user.id:
             return Response(
                 {"detail": "You do not have permission to edit this review."},
                 status=status.HTTP_403_FORBIDDEN
@@ -96,8 +130,33 @@ class ReviewDetailView(APIView):
             partial=True
         )
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
 
         return Response(serializer.data)
         
-        
\ No newline at end of file
+        
+
+
+class BusinessRatingStatsView(APIView):
+    """
+    Returns the rating distribution and rating trend of a business user.
+
+    The response contains the review count, the average rating, a
+    histogram of the 1-5 star ratings and, for each of the last 90 days
+    (UTC), the review count and average rating of the 30 days ending on
+    that day (null when there were no reviews). Totals and the histogram
+    come from BusinessReviewStats; the trend is computed with NumPy from
+    one query over the last 119 days. The result is cached until the
+    business's next review write.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        """
+        Returns:
+            200 OK: The rating stats.
+            404 Not Found: If the business user does not exist.
+        """
+        get_object_or_404(User, pk=pk, type='business')
+        return Response(get_rating_stats(pk))
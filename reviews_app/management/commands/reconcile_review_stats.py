@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from reviews_app.models import BusinessReviewStats
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the per-business review stats from the Review table.
+
+    Use it after writes that bypassed the model signals (e.g. raw SQL or
+    queryset.update()) left the stats out of sync.
+    """
+    help = "Recompute BusinessReviewStats for all or the given business users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'business_user_ids',
+            nargs='*',
+            type=int,
+            help="Business user IDs to reconcile (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        written = BusinessReviewStats.recompute(options['business_user_ids'] or None)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt review stats for {written} business users."))
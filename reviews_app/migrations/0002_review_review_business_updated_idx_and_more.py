@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'),
+        ),
+    ]
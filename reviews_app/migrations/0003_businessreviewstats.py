@@ -0,0 +1,46 @@
+# Generated by Django 5.2.9 on 2026-10-18 04:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def compute_stats(apps, schema_editor):
+    BusinessReviewStats = apps.get_model('reviews_app', 'BusinessReviewStats')
+    Review = apps.get_model('reviews_app', 'Review')
+
+    rows = Review.objects.values('business_user_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{
+            f'rating_{rating}': Count('id', filter=Q(rating=rating))
+            for rating in range(1, 6)
+        }
+    ).order_by()
+    BusinessReviewStats.objects.bulk_create([BusinessReviewStats(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0002_user_user_type_idx'),
+        ('reviews_app', '0002_review_review_business_updated_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessReviewStats',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='review_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.BigIntegerField(default=0)),
+                ('rating_1', models.IntegerField(default=0)),
+                ('rating_2', models.IntegerField(default=0)),
+                ('rating_3', models.IntegerField(default=0)),
+                ('rating_4', models.IntegerField(default=0)),
+                ('rating_5', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(compute_stats, migrations.RunPython.noop),
+    ]
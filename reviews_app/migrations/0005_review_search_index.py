@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from core.search import FullTextIndex
+
+
+review_search_index = FullTextIndex('reviews_app_review', ['description'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0004_review_review_business_rating_idx_and_more'),
+    ]
+
+    operations = [
+        review_search_index.create_operation(),
+    ]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum
 
 class Review(models.Model):
     """
@@ -30,4 +31,116 @@ class Review(models.Model):
     rating = models.IntegerField()
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'),
+            models.Index(fields=['business_user', 'rating'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', 'rating'], name='review_reviewer_rating_idx'),
+        ]
+
+
+class BusinessReviewStats(models.Model):
+    """
+    Review aggregates of one business user, keyed by the business user.
+
+    Adjusted in the same transaction as every review create, rating change
+    and delete (see reviews_app.signals), so a business's review count,
+    average rating and rating histogram are read with a single primary key
+    lookup. `recompute()` rebuilds the rows from the Review table.
+
+    Fields:
+        business_user (OneToOneField): The reviewed business user (primary key).
+        review_count (IntegerField): Number of reviews received.
+        rating_sum (BigIntegerField): Sum of all ratings received.
+        rating_1 ... rating_5 (IntegerField): Number of reviews per star rating.
+    """
+    RATINGS = range(1, 6)
+
+    business_user = models.OneToOneField(
+        'auth_app.User',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='review_stats'
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.BigIntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def histogram(self):
+        return {rating: getattr(self, f'rating_{rating}') for rating in self.RATINGS}
+
+    @classmethod
+    def get(cls, business_user_id):
+        """
+        Return the stats of a business user; users without reviews get
+        an unsaved all-zero instance.
+        """
+        stats = cls.objects.filter(pk=business_user_id).first()
+        if stats is None:
+            stats = cls(business_user_id=business_user_id)
+        return stats
+
+    @classmethod
+    def adjust(cls, business_user_id, added=None, removed=None):
+        """
+        Apply an added and/or removed rating with a single UPDATE.
+
+        Creates the row from the Review table when it does not exist yet.
+
+        Example: BusinessReviewStats.adjust(business_user_id, added=5, removed=3)
+        """
+        deltas = {'review_count': 0, 'rating_sum': 0}
+        for rating, sign in ((added, 1), (removed, -1)):
+            if rating is None:
+                continue
+            deltas['review_count'] += sign
+            deltas['rating_sum'] += sign * rating
+            if rating in cls.RATINGS:
+                field = f'rating_{rating}'
+                deltas[field] = deltas.get(field, 0) + sign
+
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if not changes:
+            return
+
+        if not cls.objects.filter(pk=business_user_id).update(**changes):
+            cls.recompute([business_user_id])
+
+    @classmethod
+    @transaction.atomic
+    def recompute(cls, business_user_ids=None):
+        """
+        Rebuild the stats of the given business users (all when None)
+        from the Review table. Returns the number of rows written.
+        """
+        reviews = Review.objects.all()
+        stats = cls.objects.all()
+        if business_user_ids is not None:
+            reviews = reviews.filter(business_user_id__in=business_user_ids)
+            stats = stats.filter(pk__in=business_user_ids)
+
+        rows = reviews.values('business_user_id').annotate(
+            review_count=Count('id'),
+            rating_sum=Sum('rating'),
+            **{
+                f'rating_{rating}': Count('id', filter=Q(rating=rating))
+                for rating in cls.RATINGS
+            }
+        ).order_by()
+
+        stats.delete()
+        return len(cls.objects.bulk_create([cls(**row) for row in rows]))
@@ -0,0 +1,149 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.utils import timezone
+
+from reviews_app.models import BusinessReviewStats, Review
+
+CACHE_TIMEOUT = getattr(settings, 'RATING_STATS_CACHE_TIMEOUT', 3600)
+TREND_DAYS = 90
+WINDOW_DAYS = 30
+SPAN_DAYS = TREND_DAYS + WINDOW_DAYS - 1
+SECONDS_PER_DAY = 86400
+
+
+def rating_stats_key(business_user_id, day):
+    return f'rating-stats:{business_user_id}:{day.isoformat()}'
+
+
+def load_ratings(business_user_id, since):
+    """
+    Return the creation times (epoch seconds) and ratings of the reviews a
+    business user received since the given datetime as two NumPy arrays,
+    read with a single query.
+    """
+    rows = list(
+        Review.objects.filter(
+            business_user_id=business_user_id,
+            created_at__gte=since
+        ).values_list('created_at', 'rating')
+    )
+    timestamps = np.fromiter(
+        (created_at.timestamp() for created_at, _ in rows), dtype=np.float64, count=len(rows)
+    )
+    ratings = np.fromiter((rating for _, rating in rows), dtype=np.int64, count=len(rows))
+    return timestamps, ratings
+
+
+def rolling_average(timestamps, ratings, origin):
+    """
+    Return the review count and average rating of the WINDOW_DAYS days
+    ending on each of the last TREND_DAYS days (UTC), as two arrays.
+    `origin` is the start of the first day of the SPAN_DAYS days involved.
+
+    Ratings are summed per day with np.bincount; every window is then the
+    difference of two cumulative sums.
+    """
+    days = np.floor((timestamps - origin.timestamp()) / SECONDS_PER_DAY).astype(np.int64)
+    in_span = (days >= 0) & (days < SPAN_DAYS)
+    daily_counts = np.bincount(days[in_span], minlength=SPAN_DAYS)
+    daily_sums = np.bincount(days[in_span], weights=ratings[in_span], minlength=SPAN_DAYS)
+
+    count_totals = np.concatenate(([0], np.cumsum(daily_counts)))
+    sum_totals = np.concatenate(([0.0], np.cumsum(daily_sums)))
+    window_counts = count_totals[WINDOW_DAYS:] - count_totals[:-WINDOW_DAYS]
+    window_sums = sum_totals[WINDOW_DAYS:] - sum_totals[:-WINDOW_DAYS]
+
+    averages = np.divide(
+        window_sums,
+        window_counts,
+        out=np.full(TREND_DAYS, np.nan),
+        where=window_counts > 0
+    )
+    return window_counts, averages
+
+
+def compute_rating_stats(business_user_id, today):
+    """
+    Compute the rating histogram and the rolling 30-day average rating
+    trend of a business user.
+
+    Totals and the histogram come from BusinessReviewStats; only the
+    reviews of the last SPAN_DAYS days are loaded for the trend.
+    """
+    stats = BusinessReviewStats.get(business_user_id)
+
+    first_day = today - timedelta(days=SPAN_DAYS - 1)
+    origin = datetime.combine(first_day, time.min, tzinfo=dt_timezone.utc)
+    timestamps, ratings = load_ratings(business_user_id, origin)
+    window_counts, averages = rolling_average(timestamps, ratings, origin)
+
+    return {
+        'business_user': business_user_id,
+        'review_count': stats.review_count,
+        'average_rating': stats.average_rating,
+        'histogram': {
+            str(rating): count for rating, count in stats.histogram.items()
+        },
+        'trend': {
+            'window_days': WINDOW_DAYS,
+            'points': [
+                {
+                    'date': (today - timedelta(days=TREND_DAYS - 1 - index)).isoformat(),
+                    'review_count': int(count),
+                    'average_rating': None if np.isnan(average) else round(float(average), 1),
+                }
+                for index, (count, average) in enumerate(zip(window_counts, averages))
+            ],
+        },
+    }
+
+
+def cache_is_shared():
+    """
+    Return whether the default cache is shared between processes.
+
+    Stats cached by another process (e.g. a background worker) are only
+    visible to the web server with a shared backend; LocMemCache and
+    DummyCache are private to each process.
+    """
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def refresh_rating_stats(business_user_id):
+    """
+    Compute today's rating stats of a business user and store them in the
+    cache, replacing any cached entry.
+    """
+    today = timezone.now().astimezone(dt_timezone.utc).date()
+    data = compute_rating_stats(business_user_id, today)
+    cache.set(rating_stats_key(business_user_id, today), data, CACHE_TIMEOUT)
+    return data
+
+
+def get_rating_stats(business_user_id):
+    """
+    Return the cached rating stats of a business user, computing them on a miss.
+    """
+    today = timezone.now().astimezone(dt_timezone.utc).date()
+    data = cache.get(rating_stats_key(business_user_id, today))
+    if data is None:
+        data = refresh_rating_stats(business_user_id)
+    return data
+
+
+def invalidate_rating_stats(business_user_id):
+    """
+    Drop the cached rating stats of a business user once the surrounding
+    transaction has committed.
+    """
+    def delete():
+        today = timezone.now().astimezone(dt_timezone.utc).date()
+        cache.delete(rating_stats_key(business_user_id, today))
+
+    transaction.on_commit(delete)
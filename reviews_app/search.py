@@ -0,0 +1,3 @@
+from core.search import FullTextIndex
+
+review_search_index = FullTextIndex('reviews_app_review', ['description'])
@@ -0,0 +1,56 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from reviews_app.models import BusinessReviewStats, Review
+from jobs_app.queue import enqueue
+from reviews_app.rating_stats import cache_is_shared, invalidate_rating_stats
+from reviews_app.tasks import warm_rating_stats
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_rating(sender, instance, update_fields=None, **kwargs):
+    """
+    Store the rating currently saved in the database as `previous_rating`
+    on the instance, so post_save receivers can apply rating deltas.
+    New reviews and saves that do not touch the rating get None.
+    """
+    instance.previous_rating = None
+
+    if instance._state.adding or (update_fields is not None and 'rating' not in update_fields):
+        return
+
+    instance.previous_rating = Review.objects.filter(
+        pk=instance.pk
+    ).values_list('rating', flat=True).first()
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review_for_business(sender, instance, created, **kwargs):
+    """
+    Count new reviews and apply rating changes to the business's stats.
+    """
+    if created:
+        BusinessReviewStats.adjust(instance.business_user_id, added=instance.rating)
+    elif getattr(instance, 'previous_rating', None) not in (None, instance.rating):
+        BusinessReviewStats.adjust(
+            instance.business_user_id,
+            added=instance.rating,
+            removed=instance.previous_rating
+        )
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review_for_business(sender, instance, **kwargs):
+    BusinessReviewStats.adjust(instance.business_user_id, removed=instance.rating)
+
+
+@receiver([post_save, post_delete], sender=Review)
+def invalidate_rating_stats_on_review_write(sender, instance, **kwargs):
+    """
+    Drop the cached rating stats after commit. With a cache shared between
+    processes, a background job rebuilds them (see `manage.py run_workers`);
+    a per-process cache is refilled by the next request instead.
+    """
+    invalidate_rating_stats(instance.business_user_id)
+    if cache_is_shared():
+        enqueue(warm_rating_stats, {'business_user_id': instance.business_user_id})
@@ -0,0 +1,12 @@
+from jobs_app.queue import task
+from reviews_app.rating_stats import refresh_rating_stats
+
+
+@task
+def warm_rating_stats(business_user_id):
+    """
+    Recompute the cached rating stats of a business user after a review
+    write, so the next profile page view is served from the cache.
+    Only enqueued when the cache is shared with the web server.
+    """
+    refresh_rating_stats(business_user_id)
@@ -1,3 +1,215 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.db.models import Avg, Count
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from auth_app.models import User
+from core.pagination import CappedListPagination
+from reviews_app.models import BusinessReviewStats, Review
+
+
+class ReviewListQueryTests(APITestCase):
+    """
+    The reviews list reads user IDs from the review row itself and must
+    not query the user table.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        self.customers = [
+            User.objects.create_user(
+                username=f"customer{index}", password="password", type="customer"
+            )
+            for index in range(3)
+        ]
+        for customer in self.customers:
+            Review.objects.create(
+                business_user=self.business_user,
+                reviewer=customer,
+                rating=5,
+                description="Great",
+            )
+        self.client.force_authenticate(self.customers[0])
+
+    def test_list_does_not_query_users(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                '/api/reviews/', {'business_user_id': self.business_user.id}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {review['reviewer'] for review in response.data},
+            {customer.id for customer in self.customers}
+        )
+        self.assertEqual(response.data[0]['business_user'], self.business_user.id)
+        self.assertFalse(
+            [query['sql'] for query in context.captured_queries if 'auth_app_user' in query['sql']]
+        )
+
+
+class ReviewListPaginationTests(APITestCase):
+    """
+    The default list is capped; cursor pages walk all reviews of a business
+    and seek through the (business_user, ordering field) indexes.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username="business", password="password", type="business"
+        )
+        other_business = User.objects.create_user(
+            username="other", password="password", type="business"
+        )
+        customer = User.objects.create_user(
+            username="customer", password="password", type="customer"
+        )
+        for rating in (5, 3, 4, 3, 5, 1, 3):
+            Review.objects.create(
+                business_user=self.business_user, reviewer=customer,
+                rating=rating, description="Review"
+            )
+        Review.objects.create(
+            business_user=other_business, reviewer=customer, rating=2, description="Other"
+        )
+        self.client.force_authenticate(customer)
+
+    def walk(self, ordering):
+        params = {
+            'business_user_id': self.business_user.id,
+            'pagination': 'cursor',
+            'ordering': ordering,
+            'page_size': 2,
+        }
+        response = self.client.get('/api/reviews/', params)
+        ids = [review['id'] for review in response.data['results']]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            ids += [review['id'] for review in response.data['results']]
+        return ids, response
+
+    def test_cursor_walk_by_rating_across_ties(self):
+        expected = list(
+            Review.objects.filter(business_user=self.business_user)
+            .order_by('rating', 'pk').values_list('pk', flat=True)
+        )
+
+        ids, last_page = self.walk('rating')
+        previous = self.client.get(last_page.data['previous'])
+
+        self.assertEqual(ids, expected)
+        self.assertEqual([review['id'] for review in previous.data['results']], expected[-3:-1])
+
+    def test_cursor_walk_by_updated_at(self):
+        expected = list(
+            Review.objects.filter(business_user=self.business_user)
+            .order_by('-updated_at', '-pk').values_list('pk', flat=True)
+        )
+
+        self.assertEqual(self.walk('-updated_at')[0], expected)
+
+    def assert_cursor_page_uses_index(self, ordering, column, index):
+        first = self.client.get('/api/reviews/', {
+            'business_user_id': self.business_user.id,
+            'pagination': 'cursor',
+            'ordering': ordering,
+            'page_size': 2,
+        })
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(first.data['next'])
+
+        sql = next(
+            query['sql'] for query in context.captured_queries
+            if f'"reviews_app_review"."{column}" ' in query['sql'].split('WHERE')[-1]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertIn(f'{index} (business_user_id=? AND {column}', plan)
+
+    def test_rating_pages_use_business_rating_index(self):
+        self.assert_cursor_page_uses_index('rating', 'rating', 'review_business_rating_idx')
+
+    def test_updated_at_pages_use_business_updated_index(self):
+        self.assert_cursor_page_uses_index('-updated_at', 'updated_at', 'review_business_updated_idx')
+
+    def test_default_list_is_capped(self):
+        with mock.patch.object(CappedListPagination, 'max_results', 4):
+            response = self.client.get('/api/reviews/', {'business_user_id': self.business_user.id})
+
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(response['X-Truncated'], 'true')
+
+
+class BusinessReviewStatsTests(APITestCase):
+    """
+    The per-business review aggregates must match a full recount after any
+    mix of creates, rating changes and deletes.
+    """
+
+    def setUp(self):
+        self.businesses = [
+            User.objects.create_user(username=f"business{index}", password="password", type="business")
+            for index in range(2)
+        ]
+        self.customers = [
+            User.objects.create_user(username=f"customer{index}", password="password", type="customer")
+            for index in range(2)
+        ]
+
+    def create_review(self, business, rating, reviewer=None):
+        return Review.objects.create(
+            business_user=business, reviewer=reviewer or self.customers[0],
+            rating=rating, description="Review"
+        )
+
+    def assert_stats_match_reviews(self):
+        for business in self.businesses:
+            reviews = Review.objects.filter(business_user=business)
+            totals = reviews.aggregate(count=Count('id'), average=Avg('rating'))
+            stats = BusinessReviewStats.get(business.id)
+
+            self.assertEqual(stats.review_count, totals['count'])
+            self.assertEqual(stats.average_rating, round(totals['average'] or 0, 1))
+            self.assertEqual(
+                stats.histogram,
+                {rating: reviews.filter(rating=rating).count() for rating in range(1, 6)}
+            )
+
+    def test_mixed_writes(self):
+        reviews = [
+            self.create_review(business, rating)
+            for business, rating in zip(self.businesses * 3, (5, 4, 3, 3, 1, 2))
+        ]
+        self.assert_stats_match_reviews()
+
+        reviews[0].rating = 2
+        reviews[0].save()
+        reviews[1].description = "Edited"
+        reviews[1].save(update_fields=['description'])
+        reviews[2].rating = 3
+        reviews[2].save()
+        self.client.force_authenticate(self.customers[0])
+        response = self.client.patch(f'/api/reviews/{reviews[3].id}/', {'rating': 5}, format='json')
+        self.assertEqual(response.status_code, 200)
+        reviews[4].delete()
+        self.assert_stats_match_reviews()
+
+        self.create_review(self.businesses[1], 4, reviewer=self.customers[1])
+        self.customers[0].delete()
+        self.assert_stats_match_reviews()
+
+    def test_missing_row_is_recomputed(self):
+        self.create_review(self.businesses[0], 5)
+        self.create_review(self.businesses[0], 3)
+        BusinessReviewStats.objects.all().delete()
+
+        self.create_review(self.businesses[0], 4, reviewer=self.customers[1])
+
+        self.assert_stats_match_reviews()
+        self.assertEqual(BusinessReviewStats.objects.get(pk=self.businesses[0].id).review_count, 3)